@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Iterator
+from collections.abc import Awaitable, Callable, Iterator, MutableSequence
 from contextlib import suppress
 from datetime import UTC, datetime, timedelta
-from functools import partial
+from functools import lru_cache, partial
 import hashlib
+import heapq
+from itertools import islice
 import json
 import logging
+from operator import itemgetter
 from pathlib import Path
 import re
+from sys import intern
 import time
 from typing import Any
 from urllib.parse import urljoin
@@ -149,6 +153,7 @@ def _format_update_error(err: Exception) -> str:
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _JOLPICA_STATS_KEY = "__jolpica_stats__"
+_FIRST_REFRESH_CONCURRENCY = 4
 _REPLAY_DELAY_REASONS = frozenset({"replay", "replay-mode", "replay-preparing"})
 _REPLAY_ONLY_ACTIVE_REASONS = frozenset({"replay", "replay-mode"})
 _ACTIVITY_LOG_EXCLUDED_SENSOR_SUFFIXES = (
@@ -165,6 +170,7 @@ MAX_DELAY_QUEUE_ITEMS = 2048
 DELAY_QUEUE_DROP_LOG_INTERVAL = 60.0
 MAX_TYRE_STINTS_PER_DRIVER = 32
 MAX_TYRE_STINT_INDEX = MAX_TYRE_STINTS_PER_DRIVER - 1
+_MAX_TYRE_STINT_INDEX_DIGITS = len(str(MAX_TYRE_STINT_INDEX))
 PITSTOP_MAX_HISTORY_PER_CAR = 10
 PITSTOP_MAX_CARS = 30
 PITSTOP_MAX_CARS_PER_PAYLOAD = 60
@@ -182,6 +188,9 @@ _RC_LOG_EVENT = f"{DOMAIN}_race_control_event"
 _RC_LOG_RESET_EVENT = f"{DOMAIN}_race_control_log_reset_event"
 _RC_LOG_WS_TYPE = f"{DOMAIN}/race_control_log/get"
 _INCIDENT_EVENT = f"{DOMAIN}_incident"
+# Field aliases the live feeds use for message timestamps and text
+_TS_KEYS: tuple[str, ...] = ("Utc", "utc", "processedAt", "timestamp")
+_RC_TEXT_KEYS: tuple[str, ...] = ("Message", "Text", "Flag")
 _INCIDENT_STREAMS: tuple[str, ...] = (
     "DriverList",
     "SessionInfo",
@@ -201,7 +210,57 @@ _DOMAIN_ROOT_INTERNAL_KEYS = frozenset(
         TRACK_MAP_WS_MARKER,
     }
 )
+# Sensor keys that require each Jolpica/Ergast coordinator.
+_RACE_SENSOR_KEYS = frozenset(
+    {
+        "next_race",
+        "current_season",
+        "weather",
+        "race_week",
+        "track_time",
+        "fia_documents",
+        "driver_points_progression",
+        "constructor_points_progression",
+        "season_results",
+        "sprint_results",
+        "lap_position_progression",
+        "calendar",
+    }
+)
+_DRIVER_STANDINGS_SENSOR_KEYS = frozenset(
+    {"driver_standings", "driver_points_progression"}
+)
+_CONSTRUCTOR_STANDINGS_SENSOR_KEYS = frozenset(
+    {"constructor_standings", "constructor_points_progression"}
+)
+_SEASON_RESULTS_SENSOR_KEYS = frozenset(
+    {
+        "season_results",
+        "driver_points_progression",
+        "constructor_points_progression",
+        "lap_position_progression",
+    }
+)
+_SPRINT_RESULTS_SENSOR_KEYS = frozenset(
+    {
+        "sprint_results",
+        "driver_points_progression",
+        "constructor_points_progression",
+        "lap_position_progression",
+    }
+)
+_SESSION_CLOCK_SENSOR_KEYS = frozenset(
+    {
+        "session_time_remaining",
+        "session_time_elapsed",
+        "race_time_to_three_hour_limit",
+    }
+)
 _FINISHING_PLUS_LAPS_RE = re.compile(r"^\+\d+\s+Laps?$", re.IGNORECASE)
+_CACHE_KEY_OFFSET_RE = re.compile(r"[?&]offset=(\d+)(?=[&#]|$)")
+_CACHE_KEY_RACE_HISTORY_RE = re.compile(
+    r"/ergast/f1/\d{4}/\d+/(results|qualifying)\.json"
+)
 
 
 def _is_replay_delay_reason(reason: str | None) -> bool:
@@ -388,18 +447,81 @@ def _format_race_control_state(payload: dict[str, Any]) -> str:
     return " - ".join(parts) if parts else "Race control update"
 
 
+def _coerce_int(value: Any) -> int | None:
+    """Coerce feed numbers and numeric strings to int, or None."""
+    if value is None:
+        return None
+    kind = type(value)
+    if kind is int:
+        return value
+    try:
+        if kind is float:
+            return int(value)
+        text = str(value).strip()
+        if not text:
+            return None
+        if text.isdigit():
+            return int(text)
+        return int(float(text))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _coerce_float(value: Any) -> float | None:
+    """Coerce feed numbers and numeric strings to float, or None."""
+    if value is None:
+        return None
+    kind = type(value)
+    if kind is float:
+        return value
+    if kind is int:
+        return float(value)
+    try:
+        text = str(value).strip()
+        return float(text) if text else None
+    except (TypeError, ValueError):
+        return None
+
+
+# TimingData line keys stored verbatim (or coerced) under a timing field name.
+# A coercer returning None means the value is unusable and is skipped.
+_TIMING_SCALAR_FIELDS: dict[str, tuple[str, Callable[[Any], Any] | None]] = {
+    "GapToLeader": ("gap_to_leader", None),
+    "InPit": ("in_pit", bool),
+    "PitOut": ("pit_out", bool),
+    "NumberOfPitStops": ("pit_stops", _coerce_int),
+    "Retired": ("retired", bool),
+    "Stopped": ("stopped", bool),
+    "Status": ("status_code", None),
+}
+
+
+def _first_value(d: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """Return the first truthy value among ``keys``, like an ``or`` chain."""
+    for key in keys:
+        value = d.get(key)
+        if value:
+            return value
+    return None
+
+
+_ISO_SECONDS_CACHE: dict[str, Any] = {"t": None, "s": ""}
+
+
+def _utcnow_iso_seconds() -> str:
+    """Return utcnow() as a seconds-precision ISO string, reused within a second."""
+    # Key and value come from the same (possibly patched) HA clock
+    now = dt_util.utcnow().replace(microsecond=0)
+    if _ISO_SECONDS_CACHE["t"] != now:
+        _ISO_SECONDS_CACHE["t"] = now
+        _ISO_SECONDS_CACHE["s"] = now.isoformat(timespec="seconds")
+    return _ISO_SECONDS_CACHE["s"]
+
+
 def _race_control_message_id(item: dict[str, Any]) -> str:
     try:
-        ts = _rc_cleanup_string(
-            item.get("Utc")
-            or item.get("utc")
-            or item.get("processedAt")
-            or item.get("timestamp")
-            or ""
-        )
-        text = _rc_cleanup_string(
-            item.get("Message") or item.get("Text") or item.get("Flag") or ""
-        )
+        ts = _rc_cleanup_string(_first_value(item, _TS_KEYS) or "")
+        text = _rc_cleanup_string(_first_value(item, _RC_TEXT_KEYS) or "")
         cat = _rc_cleanup_string(item.get("Category") or item.get("CategoryType") or "")
         material = f"{ts or ''}|{cat or ''}|{text or ''}"
     except Exception:
@@ -413,12 +535,7 @@ def _normalize_race_control_log_item(
     received_at: str | None = None,
     sequence: int | None = None,
 ) -> dict[str, Any]:
-    utc = _normalize_race_control_timestamp(
-        payload.get("Utc")
-        or payload.get("utc")
-        or payload.get("processedAt")
-        or payload.get("timestamp")
-    )
+    utc = _normalize_race_control_timestamp(_first_value(payload, _TS_KEYS))
     category = _rc_cleanup_string(
         payload.get("Category") or payload.get("CategoryType")
     )
@@ -436,7 +553,7 @@ def _normalize_race_control_log_item(
     item = {
         "event_id": event_id,
         "utc": utc,
-        "received_at": received_at or dt_util.utcnow().isoformat(timespec="seconds"),
+        "received_at": received_at or _utcnow_iso_seconds(),
         "category": category,
         "flag": flag,
         "scope": scope,
@@ -836,22 +953,81 @@ def _async_register_race_control_log_interfaces(hass: HomeAssistant) -> None:
         root[_RC_LOG_WS_MARKER] = True
 
 
-def _compute_session_fingerprint(index_payload: Any) -> str | None:
-    """Best-effort fingerprint used to reset between sessions/weekends."""
+def _hash_struct(h: Any, obj: Any) -> None:
+    """Feed a type-tagged, key-sorted encoding of ``obj`` into hash ``h``."""
+    stack: list[Any] = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            h.update(b"d%d:" % len(item))
+            for key in sorted(item, key=str, reverse=True):
+                stack.append(item[key])
+                stack.append(str(key))
+        elif isinstance(item, (list, tuple)):
+            h.update(b"l%d:" % len(item))
+            stack.extend(reversed(item))
+        elif isinstance(item, str):
+            raw = item.encode("utf-8", errors="surrogatepass")
+            h.update(b"s%d:" % len(raw))
+            h.update(raw)
+        elif item is None:
+            h.update(b"n")
+        elif isinstance(item, bool):
+            h.update(b"t" if item else b"f")
+        elif isinstance(item, int):
+            h.update(b"i%d;" % item)
+        elif isinstance(item, float):
+            h.update(b"r" + repr(item).encode("ascii") + b";")
+        else:
+            raw = str(item).encode("utf-8", errors="surrogatepass")
+            h.update(b"o%d:" % len(raw))
+            h.update(raw)
+
+
+def _session_identity(sessions: Any) -> Any:
+    if not isinstance(sessions, list):
+        return sessions
+    return [
+        (item.get("Key"), item.get("Path"))
+        for item in sessions
+        if isinstance(item, dict)
+    ]
+
+
+def _meeting_identity(meetings: Any) -> Any:
+    if not isinstance(meetings, list):
+        return meetings
+    return [
+        (
+            item.get("Key"),
+            _session_identity(item.get("Sessions") or item.get("sessions")),
+        )
+        for item in meetings
+        if isinstance(item, dict)
+    ]
+
+
+def _compute_session_fingerprint(index_payload: Any) -> bytes | None:
+    """Best-effort fingerprint used to reset between sessions/weekends.
+
+    Only meeting and session keys/paths are hashed; other index fields (names,
+    archive status) do not identify a new session.
+    """
     if not isinstance(index_payload, dict):
         return None
     try:
         meetings = index_payload.get("Meetings") or index_payload.get("meetings")
         sessions = index_payload.get("Sessions") or index_payload.get("sessions")
-        minimal = {"Meetings": meetings, "Sessions": sessions}
-        return json.dumps(minimal, sort_keys=True, default=str)[:20000]
+        h = hashlib.blake2b(digest_size=16)
+        _hash_struct(h, (_meeting_identity(meetings), _session_identity(sessions)))
+        return h.digest()
     except Exception:
         return None
 
 
 def _refresh_session_fingerprint(
-    current: str | None, index_payload: Any
-) -> tuple[str | None, bool]:
+    current: bytes | None, index_payload: Any
+) -> tuple[bytes | None, bool]:
     fp = _compute_session_fingerprint(index_payload)
     if fp is None:
         return current, False
@@ -866,13 +1042,13 @@ def _schedule_deliver_handle(
     delay: float,
     callback: Callable[[], None],
 ) -> asyncio.Handle | None:
-    if handle:
+    if handle is not None:
         with suppress(Exception):
             handle.cancel()
     try:
-        if delay > 0:
-            return loop.call_later(delay, callback)
-        return loop.call_soon(callback)
+        if delay <= 0:
+            return loop.call_soon(callback)
+        return loop.call_later(delay, callback)
     except Exception:
         return None
 
@@ -884,7 +1060,32 @@ def _schedule_message_delivery(
     deliver: Callable[[dict], None],
     msg: dict,
 ) -> asyncio.Handle | None:
-    return _schedule_deliver_handle(loop, handle, delay, lambda m=msg: deliver(m))
+    return _schedule_deliver_handle(loop, handle, delay, partial(deliver, msg))
+
+
+def _parse_signalr_message(data: Any, key: str) -> Any:
+    """Return the ``key`` payload from a SignalR frame or RPC response."""
+    if not isinstance(data, dict):
+        return None
+    messages = data.get("M")
+    if isinstance(messages, list):
+        found = next(
+            (
+                args[1]
+                for update in messages
+                if isinstance(update, dict)
+                and isinstance(args := update.get("A"), list)
+                and len(args) >= 2
+                and args[0] == key
+            ),
+            None,
+        )
+        if found is not None:
+            return found
+    result = data.get("R")
+    if isinstance(result, dict) and key in result:
+        return result.get(key)
+    return None
 
 
 def _cancel_handle(handle: asyncio.Handle | None) -> asyncio.Handle | None:
@@ -902,16 +1103,15 @@ def _call_unsub(unsub: Callable[[], None] | None) -> Callable[[], None] | None:
 
 
 def _close_unsubs(unsubs: list[Callable[[], None]]) -> None:
-    for u in list(unsubs):
-        _call_unsub(u)
-    unsubs.clear()
+    while unsubs:
+        _call_unsub(unsubs.pop())
 
 
-def _cancel_handles(handles: list[asyncio.Handle]) -> None:
-    for handle in list(handles):
+def _cancel_handles(handles: MutableSequence[asyncio.Handle]) -> None:
+    while handles:
+        handle = handles.pop()
         with suppress(Exception):
             handle.cancel()
-    handles.clear()
 
 
 def _invoke_on_loop(
@@ -1082,6 +1282,48 @@ def _apply_delay_simple(instance: Any, seconds: int) -> None:
     instance._deliver_handle = _cancel_handle(instance._deliver_handle)
 
 
+def _attach_runtime_listeners(
+    instance: Any,
+    *,
+    delay_controller: LiveDelayController | None,
+    live_state: LiveAvailabilityTracker | None,
+) -> None:
+    """Subscribe a stream coordinator to the shared delay and live-state sources.
+
+    Both sources fan out already-normalized values and invoke the listener once
+    on attach, so the coordinator's delay/replay state must be set up first.
+    """
+    instance._delay_listener = None
+    if delay_controller is not None:
+        instance._delay_listener = delay_controller.add_listener(instance.set_delay)
+    instance._live_state_unsub = None
+    if live_state is not None:
+        instance._live_state_unsub = live_state.add_listener(
+            instance._handle_live_state
+        )
+
+
+def _schedule_coalesced_deliver(instance: Any, *, always: bool = False) -> None:
+    """Fold a burst of updates into one ``_deliver()`` on the next loop pass.
+
+    Unless ``always`` is set, only replay bursts are coalesced and live
+    updates are delivered immediately. The pending handle lives in
+    ``_deliver_handle`` so ``_reset_store`` and close can cancel it.
+    """
+    if not always and not instance._replay_mode:
+        instance._deliver()
+        return
+    if instance._deliver_handle is None:
+        instance._deliver_handle = instance.hass.loop.call_soon(
+            _flush_coalesced_deliver, instance
+        )
+
+
+def _flush_coalesced_deliver(instance: Any) -> None:
+    instance._deliver_handle = None
+    instance._deliver()
+
+
 def _init_stream_delay_state(
     instance: Any,
     delay_seconds: int,
@@ -1093,17 +1335,12 @@ def _init_stream_delay_state(
     instance._deliver_handle = None
     instance._bus = bus
     instance._unsub = None
-    instance._delay_listener = None
     _init_delayed_ingest_state(instance)
     instance._delay = max(0, int(delay_seconds or 0))
     instance._replay_mode = False
-    if delay_controller is not None:
-        instance._delay_listener = delay_controller.add_listener(instance.set_delay)
-    instance._live_state_unsub = None
-    if live_state is not None:
-        instance._live_state_unsub = live_state.add_listener(
-            instance._handle_live_state
-        )
+    _attach_runtime_listeners(
+        instance, delay_controller=delay_controller, live_state=live_state
+    )
 
 
 def _close_stream_delay_state(instance: Any) -> None:
@@ -1115,7 +1352,7 @@ def _close_stream_delay_state(instance: Any) -> None:
 
 
 def _apply_delay_handles_only(
-    instance: Any, seconds: int, handles: list[asyncio.Handle]
+    instance: Any, seconds: int, handles: MutableSequence[asyncio.Handle]
 ) -> None:
     new_delay = max(0, int(seconds or 0))
     if new_delay == instance._delay:
@@ -1153,63 +1390,71 @@ def _init_signalr_state(
     instance._deliver_handle = None
     instance._bus = bus
     instance._unsub = None
-    instance._delay_listener = None
     _init_delayed_ingest_state(instance)
     instance._delay = max(0, int(delay_seconds or 0))
     instance._replay_mode = False
-    if delay_controller is not None:
-        instance._delay_listener = delay_controller.add_listener(instance.set_delay)
-    instance._live_state_unsub = None
-    if live_state is not None:
-        instance._live_state_unsub = live_state.add_listener(
-            instance._handle_live_state
-        )
+    _attach_runtime_listeners(
+        instance, delay_controller=delay_controller, live_state=live_state
+    )
 
 
 class _SessionFingerprintMixin:
     _session_coord: Any
-    _session_fingerprint: str | None
+    _session_fingerprint: bytes | None
+    _session_fingerprint_payload: Any
+
+    def _prime_session_fingerprint(self) -> None:
+        payload = getattr(self._session_coord, "data", None)
+        self._session_fingerprint = _compute_session_fingerprint(payload)
+        self._session_fingerprint_payload = payload
 
     def _on_session_index_update(self) -> None:
-        fp, changed = _refresh_session_fingerprint(
-            self._session_fingerprint, getattr(self._session_coord, "data", None)
-        )
+        payload = getattr(self._session_coord, "data", None)
+        # The index coordinator replaces its payload wholesale on refresh, so an
+        # unchanged object means an unchanged fingerprint.
+        if payload is not None and payload is self._session_fingerprint_payload:
+            return
+        fp, changed = _refresh_session_fingerprint(self._session_fingerprint, payload)
         if fp is None:
             return
+        self._session_fingerprint_payload = payload
         self._session_fingerprint = fp
         if changed:
             _clear_delayed_ingest_state(self)
             self._reset_store()
 
 
+def _driver_has_identity(entry: Any) -> bool:
+    return isinstance(entry, dict) and bool(
+        entry.get("tla") or entry.get("name") or entry.get("team")
+    )
+
+
 def _seed_driver_map_from_ergast(
     hass: HomeAssistant,
     config_entry: ConfigEntry | None,
     driver_map: dict[str, dict[str, Any]],
 ) -> None:
     """Fallback identity mapping using Ergast/Jolpica driver standings."""
+    if not config_entry:
+        return
     try:
-        if not config_entry:
-            return
         reg = hass.data.get(DOMAIN, {}).get(config_entry.entry_id)
         if not isinstance(reg, dict):
             return
-        driver_coord = reg.get("driver_coordinator")
-        data = getattr(driver_coord, "data", None) or {}
-        standings = (
-            (data.get("MRData") or {})
-            .get("StandingsTable", {})
-            .get("StandingsLists", [])
-        )
-        if not isinstance(standings, list) or not standings:
+        data = getattr(reg.get("driver_coordinator"), "data", None)
+        try:
+            ds = data["MRData"]["StandingsTable"]["StandingsLists"][0][
+                "DriverStandings"
+            ]
+        except (KeyError, TypeError, IndexError):
             return
-        ds = (standings[0] or {}).get("DriverStandings", [])
         if not isinstance(ds, list):
             return
         for item in ds:
             if not isinstance(item, dict):
                 continue
-            driver = item.get("Driver") or {}
+            driver = item.get("Driver")
             if not isinstance(driver, dict):
                 continue
             rn = str(driver.get("permanentNumber") or "").strip()
@@ -1220,29 +1465,24 @@ def _seed_driver_map_from_ergast(
             ):
                 continue
             rn = str(int(rn))
-            existing = driver_map.get(rn)
-            if isinstance(existing, dict) and (
-                existing.get("tla") or existing.get("name") or existing.get("team")
-            ):
+            if _driver_has_identity(driver_map.get(rn)):
                 continue
             code = driver.get("code") or driver.get("driverId")
-            given = driver.get("givenName")
-            family = driver.get("familyName")
-            name = None
-            try:
-                parts = [p for p in (given, family) if p]
-                name = " ".join(parts) if parts else None
-            except Exception:
-                name = None
-            constructors = item.get("Constructors") or []
-            team = None
-            if isinstance(constructors, list) and constructors:
-                c0 = constructors[0]
-                if isinstance(c0, dict):
-                    team = c0.get("name")
+            name = " ".join(
+                str(part)
+                for part in (driver.get("givenName"), driver.get("familyName"))
+                if part
+            )
+            constructors = item.get("Constructors")
+            c0 = (
+                constructors[0]
+                if isinstance(constructors, list) and constructors
+                else None
+            )
+            team = c0.get("name") if isinstance(c0, dict) else None
             driver_map[rn] = {
                 "tla": str(code).strip()[:PITSTOP_MAX_TEXT_CHARS] if code else None,
-                "name": str(name).strip()[:PITSTOP_MAX_TEXT_CHARS] if name else None,
+                "name": name.strip()[:PITSTOP_MAX_TEXT_CHARS] if name else None,
                 "team": str(team).strip()[:PITSTOP_MAX_TEXT_CHARS] if team else None,
             }
             if len(driver_map) >= PITSTOP_MAX_CARS:
@@ -1260,52 +1500,46 @@ def _ensure_jolpica_stats_reporting(hass: HomeAssistant) -> None:
     if isinstance(stats, dict) and callable(stats.get("unsub")):
         return
 
-    root[_JOLPICA_STATS_KEY] = {
+    stats_entry: dict[str, Any] = {
         "since": dt_util.utcnow().isoformat(),
         "unsub": None,
+        "counts": {},
     }
+    root[_JOLPICA_STATS_KEY] = stats_entry
 
     async def _log_and_reset(_now) -> None:
-        # Snapshot and reset counts (counts live in hass.data[DOMAIN][_JOLPICA_STATS_KEY])
-        root2 = hass.data.get(DOMAIN, {}) or {}
-        s = root2.get(_JOLPICA_STATS_KEY) or {}
-        counts = s.get("counts") if isinstance(s, dict) else None
+        until = dt_util.utcnow().isoformat()
+        # Snapshot and reset counts (helpers record misses into stats_entry["counts"])
+        counts = stats_entry.get("counts")
         if not isinstance(counts, dict) or not counts:
             # Still update since to avoid misleading "since" windows.
-            with suppress(Exception):
-                s["since"] = dt_util.utcnow().isoformat()
+            stats_entry["since"] = until
             return
 
-        total = 0
         try:
-            total = int(sum(int(v) for v in counts.values()))
+            miss_counts = {k: int(v) for k, v in counts.items()}
         except Exception:
-            total = 0
+            miss_counts = {}
+        total = sum(miss_counts.values())
 
         # Top endpoints by MISS count
-        try:
-            top = sorted(counts.items(), key=lambda kv: int(kv[1]), reverse=True)[:10]
-        except Exception:
-            top = []
+        top = sorted(miss_counts.items(), key=itemgetter(1), reverse=True)[:10]
 
-        since = s.get("since")
-        until = dt_util.utcnow().isoformat()
         _LOGGER.info(
             "Jolpica MISS summary (dev) since=%s until=%s total=%s top=%s",
-            since,
+            stats_entry.get("since"),
             until,
             total,
-            [(k, int(v)) for k, v in top],
+            top,
         )
 
         # Reset
-        with suppress(Exception):
-            s["counts"] = {}
-            s["since"] = until
+        stats_entry["counts"] = {}
+        stats_entry["since"] = until
 
-    unsub = async_track_time_interval(hass, _log_and_reset, timedelta(days=1))
-    with suppress(Exception):
-        root[_JOLPICA_STATS_KEY]["unsub"] = unsub
+    stats_entry["unsub"] = async_track_time_interval(
+        hass, _log_and_reset, timedelta(days=1)
+    )
 
 
 # Keep treating the current Grand Prix as "next" for a short period after
@@ -1313,6 +1547,9 @@ def _ensure_jolpica_stats_reporting(hass: HomeAssistant) -> None:
 # immediately when a race starts.
 
 
+_MANUAL_UPDATE_LOG_PREFIX = "Manually updated "
+
+
 class CoordinatorLogger(logging.LoggerAdapter):
     """Logger adapter that can suppress noisy manual-update debug lines."""
 
@@ -1327,10 +1564,12 @@ class CoordinatorLogger(logging.LoggerAdapter):
         self._suppress_manual = suppress_manual
 
     def debug(self, msg: str, *args, **kwargs):
+        if not self.isEnabledFor(logging.DEBUG):
+            return
         if (
             self._suppress_manual
-            and isinstance(msg, str)
-            and msg.startswith("Manually updated ")
+            and type(msg) is str
+            and msg.startswith(_MANUAL_UPDATE_LOG_PREFIX)
         ):
             return
         super().debug(msg, *args, **kwargs)
@@ -1385,6 +1624,60 @@ def _is_no_spoiler_jolpica_blocked(coordinator: DataUpdateCoordinator) -> bool:
         return False
 
 
+async def _async_run_bounded(
+    slots: asyncio.Semaphore, refresh: Callable[[], Awaitable[Any]]
+) -> None:
+    async with slots:
+        await refresh()
+
+
+async def _async_refresh_concurrently(
+    slots: asyncio.Semaphore, *refreshes: Callable[[], Awaitable[Any]]
+) -> None:
+    """Run ``refreshes`` concurrently, at most ``slots`` at a time.
+
+    Within each wave at most ``_FIRST_REFRESH_CONCURRENCY`` refreshes run at
+    once, so enabling every feature does not burst the upstream APIs at Home
+    Assistant startup. Each refresh is created only once it holds
+    a slot. The first failure cancels the rest and is re-raised unwrapped so
+    ``ConfigEntryNotReady`` still reaches Home Assistant.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            for refresh in refreshes:
+                group.create_task(_async_run_bounded(slots, refresh))
+    except ExceptionGroup as err:
+        raise err.exceptions[0] from None
+
+
+async def _async_first_refresh_all(
+    slots: asyncio.Semaphore, *coordinators: Any
+) -> None:
+    """Run first refreshes concurrently for the coordinators that were created."""
+    await _async_refresh_concurrently(
+        slots,
+        *(
+            coordinator.async_config_entry_first_refresh
+            for coordinator in coordinators
+            if coordinator is not None
+        ),
+    )
+
+
+async def _async_first_refresh_fia_documents(
+    coordinator: FiaDocumentsCoordinator,
+) -> None:
+    """Run the FIA documents first refresh without failing entry setup."""
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady as err:
+        coordinator.async_set_updated_data(coordinator.build_empty_result())
+        _LOGGER.warning(
+            "FIA documents unavailable during setup; continuing without documents: %s",
+            err.__cause__ or err,
+        )
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Create the global NoSpoilerModeManager once when the domain first loads."""
     domain_root = hass.data.setdefault(DOMAIN, {})
@@ -1406,53 +1699,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # ``disabled_sensors`` stores the keys the user explicitly unchecked.
     # Everything else (including new keys added in future versions) is enabled.
     raw_disabled = entry.data.get("disabled_sensors") or []
-    disabled: set[str] = {k for k in raw_disabled if k in SUPPORTED_SENSOR_KEYS}
-    enabled = SUPPORTED_SENSOR_KEYS - disabled
+    enabled = SUPPORTED_SENSOR_KEYS.difference(raw_disabled)
 
     # Determine which Jolpica/Ergast coordinators are actually required.
-    need_race = any(
-        k in enabled
-        for k in (
-            "next_race",
-            "current_season",
-            "weather",
-            "race_week",
-            "track_time",
-            "fia_documents",
-            "driver_points_progression",
-            "constructor_points_progression",
-            "season_results",
-            "sprint_results",
-            "lap_position_progression",
-            "calendar",
-        )
-    )
-    need_driver = any(
-        k in enabled for k in ("driver_standings", "driver_points_progression")
-    )
-    need_constructor = any(
-        k in enabled
-        for k in ("constructor_standings", "constructor_points_progression")
-    )
+    need_race = not enabled.isdisjoint(_RACE_SENSOR_KEYS)
+    need_driver = not enabled.isdisjoint(_DRIVER_STANDINGS_SENSOR_KEYS)
+    need_constructor = not enabled.isdisjoint(_CONSTRUCTOR_STANDINGS_SENSOR_KEYS)
     need_last_race = "last_race_results" in enabled
-    need_season_results = any(
-        k in enabled
-        for k in (
-            "season_results",
-            "driver_points_progression",
-            "constructor_points_progression",
-            "lap_position_progression",
-        )
-    )
-    need_sprint_results = any(
-        k in enabled
-        for k in (
-            "sprint_results",
-            "driver_points_progression",
-            "constructor_points_progression",
-            "lap_position_progression",
-        )
-    )
+    need_season_results = not enabled.isdisjoint(_SEASON_RESULTS_SENSOR_KEYS)
+    need_sprint_results = not enabled.isdisjoint(_SPRINT_RESULTS_SENSOR_KEYS)
     need_lap_position_progression = "lap_position_progression" in enabled
     need_fia_docs = "fia_documents" in enabled
 
@@ -1491,39 +1746,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     with suppress(Exception):
         from time import monotonic as _mono
 
-        from yarl import URL
-
         now = _mono()
         wall_now = time.time()
+        # Exact endpoint probes, checked in order before the pattern-based rules.
+        ttl_probes = (
+            ("/ergast/f1/current.json", TTL_CURRENT),
+            ("/ergast/f1/current/driverstandings.json", TTL_STANDINGS),
+            ("/ergast/f1/current/constructorstandings.json", TTL_STANDINGS),
+            ("/ergast/f1/current/last/results.json", TTL_LAST_RESULTS),
+            ("/ergast/f1/current/sprint.json", TTL_SPRINT),
+        )
 
-        def _startup_ttl_for_key(k: str) -> int:
+        def _startup_ttl_for_key(kk: str) -> int:
             """Return TTL for persisted cache entries (seconds).
 
             This is a conservative mapping that favors fewer network requests
             while ensuring the newest season results page refreshes within hours.
+            Persisted keys are request URLs loaded from JSON, so always ``str``.
             """
-            kk = str(k)
-            if "/ergast/f1/current.json" in kk:
-                return TTL_CURRENT
-            if (
-                "/ergast/f1/current/driverstandings.json" in kk
-                or "/ergast/f1/current/constructorstandings.json" in kk
-            ):
-                return TTL_STANDINGS
-            if "/ergast/f1/current/last/results.json" in kk:
-                return TTL_LAST_RESULTS
-            if "/ergast/f1/current/sprint.json" in kk:
-                return TTL_SPRINT
+            for probe, probe_ttl in ttl_probes:
+                if probe in kk:
+                    return probe_ttl
             if "/ergast/f1/" in kk and "/laps.json" in kk:
                 return TTL_LAP_POSITION_STABLE
             if "/ergast/f1/current/results.json" in kk:
                 # Best-effort per-page TTL from offset (latest pages have higher offsets).
-                try:
-                    q = URL(kk).query
-                    offset_raw = str(q.get("offset") or "0")
-                    offset = int(offset_raw) if offset_raw.isdigit() else 0
-                except Exception:
-                    offset = 0
+                match = _CACHE_KEY_OFFSET_RE.search(kk)
+                offset = int(match.group(1)) if match else 0
                 # Heuristic: higher offsets tend to be nearer the latest results.
                 if offset >= 300:
                     return TTL_SEASON_LATEST_PAGE
@@ -1536,29 +1785,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 or "/qualifying.json" in kk
             ):
                 return TTL_NEXT_RACE_HISTORY
-            if re.search(r"/ergast/f1/\d{4}/\d+/(results|qualifying)\.json", kk):
+            if _CACHE_KEY_RACE_HISTORY_RE.search(kk):
                 return TTL_NEXT_RACE_HISTORY
             # Default: keep a modest TTL
             return 6 * 3600
 
         for k, v in (persisted_map or {}).items():
-            data = v.get("data") if isinstance(v, dict) else None
+            if not isinstance(v, dict):
+                continue
+            data = v.get("data")
             if data is None:
                 continue
-            ttl = int(_startup_ttl_for_key(str(k)) or 0)
-            saved_at = None
             try:
-                saved_at = float(v.get("saved_at")) if isinstance(v, dict) else None
-            except Exception:
-                saved_at = None
+                saved_at = float(v.get("saved_at") or 0.0)
+            except (TypeError, ValueError):
+                saved_at = 0.0
             # Apply remaining TTL relative to saved_at, so old persisted data does not
             # get an artificially "fresh" expiry after restarts.
-            try:
-                age = max(0.0, wall_now - float(saved_at)) if saved_at else 0.0
-            except Exception:
-                age = 0.0
-            remaining = max(0.0, float(ttl) - float(age))
-            http_cache[k] = (now + remaining, data)
+            age = max(0.0, wall_now - saved_at) if saved_at else 0.0
+            http_cache[k] = (now + max(0.0, _startup_ttl_for_key(k) - age), data)
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Seeded in-memory cache from persistent store with %d keys",
@@ -2022,70 +2267,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             live_state=live_state,
         )
 
-    if race_coordinator:
-        await race_coordinator.async_config_entry_first_refresh()
+    # Jolpica/Ergast and Live Timing index refreshes are independent HTTP round
+    # trips, so run them concurrently. Later waves read data from earlier ones.
+    first_refresh_slots = asyncio.Semaphore(_FIRST_REFRESH_CONCURRENCY)
+    await _async_first_refresh_all(
+        first_refresh_slots,
+        race_coordinator,
+        driver_coordinator,
+        constructor_coordinator,
+        last_race_coordinator,
+        sprint_results_coordinator,
+        session_coordinator,
+    )
+    dependent_refreshes: list[Callable[[], Awaitable[Any]]] = [
+        coordinator.async_config_entry_first_refresh
+        for coordinator in (season_results_coordinator, starting_grid_coordinator)
+        if coordinator is not None
+    ]
     if next_race_history_coordinator:
-        await next_race_history_coordinator.async_refresh()
-    if driver_coordinator:
-        await driver_coordinator.async_config_entry_first_refresh()
-    if constructor_coordinator:
-        await constructor_coordinator.async_config_entry_first_refresh()
-    if last_race_coordinator:
-        await last_race_coordinator.async_config_entry_first_refresh()
-    if season_results_coordinator:
-        await season_results_coordinator.async_config_entry_first_refresh()
-    if sprint_results_coordinator:
-        await sprint_results_coordinator.async_config_entry_first_refresh()
-    if lap_position_progression_coordinator:
-        await lap_position_progression_coordinator.async_config_entry_first_refresh()
+        dependent_refreshes.append(next_race_history_coordinator.async_refresh)
     if fia_documents_coordinator:
-        try:
-            await fia_documents_coordinator.async_config_entry_first_refresh()
-        except ConfigEntryNotReady as err:
-            fia_documents_coordinator.async_set_updated_data(
-                fia_documents_coordinator.build_empty_result()
-            )
-            _LOGGER.warning(
-                "FIA documents unavailable during setup; continuing without documents: %s",
-                err.__cause__ or err,
-            )
-    await session_coordinator.async_config_entry_first_refresh()
-    if starting_grid_coordinator:
-        await starting_grid_coordinator.async_config_entry_first_refresh()
-    if track_status_coordinator:
-        await track_status_coordinator.async_config_entry_first_refresh()
-    if session_status_coordinator:
-        await session_status_coordinator.async_config_entry_first_refresh()
-    if session_info_coordinator:
-        await session_info_coordinator.async_config_entry_first_refresh()
-    if race_control_coordinator:
-        await race_control_coordinator.async_config_entry_first_refresh()
+        dependent_refreshes.append(
+            partial(_async_first_refresh_fia_documents, fia_documents_coordinator)
+        )
+    await _async_refresh_concurrently(first_refresh_slots, *dependent_refreshes)
+    await _async_first_refresh_all(
+        first_refresh_slots,
+        lap_position_progression_coordinator,
+        track_status_coordinator,
+        session_status_coordinator,
+        session_info_coordinator,
+        race_control_coordinator,
+        weather_data_coordinator,
+        lap_count_coordinator,
+        incident_coordinator,
+    )
+    # Live mode attaches to the race control and session status coordinators.
     if live_mode_coordinator:
         await live_mode_coordinator.async_config_entry_first_refresh()
-    if weather_data_coordinator:
-        await weather_data_coordinator.async_config_entry_first_refresh()
-    if lap_count_coordinator:
-        await lap_count_coordinator.async_config_entry_first_refresh()
-    if incident_coordinator:
-        await incident_coordinator.async_config_entry_first_refresh()
 
     # Conditionally create live-stream coordinators (require enable_rc + sensor enabled).
     # Replay/auth-gated coordinators stay registered in live mode and expose
     # unavailable state until their backing stream capability becomes available.
-    need_drivers = any(k in enabled for k in ("driver_list",))
-    need_top_three = any(k in enabled for k in ("top_three",))
-    need_pitstops = any(k in enabled for k in ("pitstops",))
-    need_championship_prediction = any(
-        k in enabled for k in ("championship_prediction",)
-    )
-    need_session_clock = any(
-        k in enabled
-        for k in (
-            "session_time_remaining",
-            "session_time_elapsed",
-            "race_time_to_three_hour_limit",
-        )
-    )
+    need_drivers = "driver_list" in enabled
+    need_top_three = "top_three" in enabled
+    need_pitstops = "pitstops" in enabled
+    need_championship_prediction = "championship_prediction" in enabled
+    need_session_clock = not enabled.isdisjoint(_SESSION_CLOCK_SENSOR_KEYS)
     if enable_rc and need_session_clock:
         session_clock_coordinator = SessionClockCoordinator(
             hass,
@@ -2098,7 +2326,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             live_supervisor=live_supervisor,
             replay_controller=replay_controller,
         )
-        await session_clock_coordinator.async_config_entry_first_refresh()
 
     drivers_coordinator = None
     if enable_rc and need_drivers:
@@ -2111,7 +2338,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             delay_controller=delay_controller,
             live_state=live_state,
         )
-        await drivers_coordinator.async_config_entry_first_refresh()
 
     if enable_rc and need_top_three:
         top_three_coordinator = TopThreeCoordinator(
@@ -2123,7 +2349,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             delay_controller=delay_controller,
             live_state=live_state,
         )
-        await top_three_coordinator.async_config_entry_first_refresh()
 
     pitstop_coordinator = None
     if enable_rc and need_pitstops:
@@ -2138,7 +2363,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             history_limit=10,
             drivers_coordinator=drivers_coordinator,
         )
-        await pitstop_coordinator.async_config_entry_first_refresh()
 
     championship_prediction_coordinator = None
     if enable_rc and need_championship_prediction:
@@ -2151,7 +2375,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             delay_controller=delay_controller,
             live_state=live_state,
         )
-        await championship_prediction_coordinator.async_config_entry_first_refresh()
+
+    await _async_first_refresh_all(
+        first_refresh_slots,
+        session_clock_coordinator,
+        drivers_coordinator,
+        top_three_coordinator,
+        championship_prediction_coordinator,
+    )
+    # Pit stops attach to the drivers coordinator, so refresh them afterwards.
+    if pitstop_coordinator:
+        await pitstop_coordinator.async_config_entry_first_refresh()
 
     def _track_map_position_source() -> str:
         if operation_mode == OPERATION_MODE_DEVELOPMENT:
@@ -2321,6 +2555,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+_WEATHER_SIGNATURE_KEYS = (
+    "AirTemp",
+    "TrackTemp",
+    "Humidity",
+    "Pressure",
+    "Rainfall",
+    "WindDirection",
+    "WindSpeed",
+)
+
+
+def _weather_signature(msg: dict) -> tuple[str, ...]:
+    """Return the core weather readings used to detect heartbeat duplicates.
+
+    Readings are compared as strings, so ``"25.0"`` and ``25.0`` match while
+    ``1`` and ``1.0`` do not.
+    """
+    return tuple(str(msg.get(k)) for k in _WEATHER_SIGNATURE_KEYS)
+
+
 class WeatherDataCoordinator(DataUpdateCoordinator):
     """Coordinator for WeatherData updates using SignalR, mirrors Track/Session behavior."""
 
@@ -2350,6 +2604,7 @@ class WeatherDataCoordinator(DataUpdateCoordinator):
             delay_controller=delay_controller,
             live_state=live_state,
         )
+        self._last_signature: tuple[str, ...] | None = None
 
     async def async_close(self, *_):
         self._unsub = _call_unsub(self._unsub)
@@ -2372,7 +2627,7 @@ class WeatherDataCoordinator(DataUpdateCoordinator):
     @staticmethod
     def _has_timestamp(d: dict) -> bool:
         try:
-            return any(k in d for k in ("Utc", "utc", "processedAt", "timestamp"))
+            return any(k in d for k in _TS_KEYS)
         except Exception:
             return False
 
@@ -2386,56 +2641,29 @@ class WeatherDataCoordinator(DataUpdateCoordinator):
             return False
         if self._has_timestamp(msg):
             return False
-        last = self._last_message if isinstance(self._last_message, dict) else None
-        if not last:
-            return False
-        keys = (
-            "AirTemp",
-            "TrackTemp",
-            "Humidity",
-            "Pressure",
-            "Rainfall",
-            "WindDirection",
-            "WindSpeed",
-        )
-        try:
-            for k in keys:
-                if str(last.get(k)) != str(msg.get(k)):
-                    return False
-            return True
-        except Exception:
+        if not isinstance(self._last_message, dict) or not self._last_message:
             return False
+        return _weather_signature(msg) == self._last_signature
 
     @staticmethod
     def _parse_message(data):
-        if not isinstance(data, dict):
-            return None
-        messages = data.get("M")
-        if isinstance(messages, list):
-            for update in messages:
-                args = update.get("A", [])
-                if len(args) >= 2 and args[0] == "WeatherData":
-                    return args[1]
-        result = data.get("R")
-        if isinstance(result, dict) and "WeatherData" in result:
-            return result.get("WeatherData")
-        return None
+        return _parse_signalr_message(data, "WeatherData")
 
     def _deliver(self, msg: dict) -> None:
         if _is_no_spoiler_blocked(self):
             return
+        if self.available and msg == self.data:
+            # Repeat of the published payload; skip the listener fan-out
+            self._last_message = msg
+            return
         self.available = True
         self._last_message = msg
+        self._last_signature = _weather_signature(msg)
         self.data_list = [msg]
         self.async_set_updated_data(msg)
         if _LOGGER.isEnabledFor(logging.DEBUG):
             with suppress(Exception):
-                keys = list((msg or {}).keys())[:6]
-                _LOGGER.debug(
-                    "WeatherData delivered at %s keys=%s",
-                    dt_util.utcnow().isoformat(timespec="seconds"),
-                    keys,
-                )
+                _LOGGER.debug("WeatherData delivered keys=%s", list(islice(msg, 6)))
 
     async def async_config_entry_first_refresh(self):
         await super().async_config_entry_first_refresh()
@@ -2502,7 +2730,8 @@ class RaceControlCoordinator(DataUpdateCoordinator):
         self.available = False
         self._last_message = None
         self.data_list: list[dict] = []
-        self._deliver_handles: list[asyncio.Handle] = []
+        # Handles fire in scheduling order, so a delivery pops from the left
+        self._deliver_handles: deque[asyncio.Handle] = deque()
         self._bus = bus
         self._unsub: Callable[[], None] | None = None
         self._delay_listener: Callable[[], None] | None = None
@@ -2511,9 +2740,11 @@ class RaceControlCoordinator(DataUpdateCoordinator):
         if delay_controller is not None:
             self._delay_listener = delay_controller.add_listener(self.set_delay)
         # For duplicate filtering and startup replay suppression
-        self._seen_ids_set: set[str] = set()
-        self._seen_ids_order = deque(maxlen=1024)
+        # Insertion-ordered dict doubles as a bounded FIFO set of seen keys
+        self._seen_ids: dict[tuple[str, ...], None] = {}
         self._startup_cutoff: datetime | None = None
+        self._last_ts_raw: Any = None
+        self._last_ts: datetime | None = None
         self._dev_mode = (
             bool(config_entry)
             and config_entry.data.get(CONF_OPERATION_MODE, DEFAULT_OPERATION_MODE)
@@ -2529,11 +2760,7 @@ class RaceControlCoordinator(DataUpdateCoordinator):
             with suppress(Exception):
                 self._unsub()
             self._unsub = None
-        if self._deliver_handles:
-            for handle in list(self._deliver_handles):
-                with suppress(Exception):
-                    handle.cancel()
-            self._deliver_handles.clear()
+        _cancel_handles(self._deliver_handles)
         if self._delay_listener:
             with suppress(Exception):
                 self._delay_listener()
@@ -2549,20 +2776,7 @@ class RaceControlCoordinator(DataUpdateCoordinator):
 
     @staticmethod
     def _parse_message(data):
-        if not isinstance(data, dict):
-            return None
-        # Live feed entries
-        messages = data.get("M")
-        if isinstance(messages, list):
-            for update in messages:
-                args = update.get("A", [])
-                if len(args) >= 2 and args[0] == "RaceControlMessages":
-                    return args[1]
-        # RPC response
-        result = data.get("R")
-        if isinstance(result, dict) and "RaceControlMessages" in result:
-            return result.get("RaceControlMessages")
-        return None
+        return _parse_signalr_message(data, "RaceControlMessages")
 
     @staticmethod
     def _extract_items(msg) -> list[dict]:
@@ -2577,16 +2791,20 @@ class RaceControlCoordinator(DataUpdateCoordinator):
             # Some payloads contain { "Messages": { "1": {...}, "2": {...}, ... } }
             if isinstance(messages, dict) and messages:
                 try:
-                    numeric_keys = [k for k in messages.keys() if str(k).isdigit()]
-                    # Sort by numeric key to preserve order if automations iterate
-                    numeric_keys.sort(key=lambda x: int(x))
+                    # Sort by numeric key to preserve order if automations iterate;
+                    # JSON object keys are already strings.
+                    numeric_keys = sorted(
+                        (int(k), k)
+                        for k in messages
+                        if isinstance(k, str) and k.isdigit()
+                    )
                     result: list[dict] = []
-                    for key in numeric_keys:
-                        val = messages.get(key)
+                    for num, key in numeric_keys:
+                        val = messages[key]
                         if isinstance(val, dict):
                             item = dict(val)
                             # Provide stable id if not present
-                            item.setdefault("id", int(key))
+                            item.setdefault("id", num)
                             result.append(item)
                     if result:
                         return result
@@ -2603,61 +2821,82 @@ class RaceControlCoordinator(DataUpdateCoordinator):
     def _message_id(item: dict) -> str:
         return _race_control_message_id(item)
 
+    @staticmethod
+    def _message_key(item: dict) -> tuple[str, ...]:
+        """Return the dedup key for an item without hashing it into an event id.
+
+        Fields are cleaned exactly like the material of _race_control_message_id,
+        so two items share a key whenever they would share an event id.
+        """
+        return (
+            _rc_cleanup_string(_first_value(item, _TS_KEYS) or "") or "",
+            _rc_cleanup_string(item.get("Category") or item.get("CategoryType") or "")
+            or "",
+            _rc_cleanup_string(_first_value(item, _RC_TEXT_KEYS) or "") or "",
+        )
+
     def _on_bus_message(self, msg: dict) -> None:
         if not isinstance(msg, (dict, list)):
             return
         items = self._extract_items(msg)
         if not items:
             return
+        cutoff = self._startup_cutoff
+        seen = self._seen_ids
+        pending: list[dict] = []
         for item in items:
             # Startup cutoff: ignore historical within 30s before now
-            with suppress(Exception):
-                ts_raw = (
-                    item.get("Utc")
-                    or item.get("utc")
-                    or item.get("processedAt")
-                    or item.get("timestamp")
-                )
+            if cutoff is not None:
+                ts_raw = _first_value(item, _TS_KEYS)
                 if ts_raw:
-                    ts = datetime.fromisoformat(str(ts_raw).replace("Z", "+00:00"))
-                    if ts.tzinfo is None:
-                        ts = ts.replace(tzinfo=UTC)
-                    if self._startup_cutoff and ts < self._startup_cutoff:
+                    ts = self._parse_item_ts(ts_raw)
+                    if ts is not None and ts < cutoff:
                         continue
-            ident = self._message_id(item)
-            if ident in self._seen_ids_set:
+            ident = self._message_key(item)
+            if ident in seen:
                 continue
-            # Evict if needed then add
-            if len(self._seen_ids_order) == self._seen_ids_order.maxlen:
-                with suppress(Exception):
-                    old = self._seen_ids_order.popleft()
-                    self._seen_ids_set.discard(old)
-            self._seen_ids_order.append(ident)
-            self._seen_ids_set.add(ident)
-            # Schedule/coalesce delivery
-            self._schedule_deliver(item)
-
-    def _schedule_deliver(self, item: dict) -> None:
-        handle: asyncio.Handle | None = None
-
-        def _callback(m=item):
-            nonlocal handle
-            try:
-                self._deliver(m)
-            finally:
-                if handle:
-                    with suppress(ValueError):
-                        self._deliver_handles.remove(handle)
-                    handle = None
+            seen[ident] = None
+            # Evict the oldest key once the window is full
+            if len(seen) > 1024:
+                del seen[next(iter(seen))]
+            pending.append(item)
+        # Schedule the whole frame behind a single loop callback
+        if pending:
+            self._schedule_deliver(pending)
+
+    def _parse_item_ts(self, ts_raw: Any) -> datetime | None:
+        # Bursts often repeat the same timestamp; reuse the last parse.
+        if ts_raw == self._last_ts_raw:
+            return self._last_ts
+        text = str(ts_raw)
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        try:
+            ts = datetime.fromisoformat(text)
+        except ValueError:
+            ts = None
+        else:
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=UTC)
+        self._last_ts_raw = ts_raw
+        self._last_ts = ts
+        return ts
 
+    def _schedule_deliver(self, items: list[dict]) -> None:
         loop = self.hass.loop
         delay = 0 if self._replay_mode else self._delay
         if delay > 0:
-            handle = loop.call_later(delay, _callback)
+            handle = loop.call_later(delay, self._deliver_scheduled, items)
         else:
-            handle = loop.call_soon(_callback)
+            handle = loop.call_soon(self._deliver_scheduled, items)
         self._deliver_handles.append(handle)
 
+    def _deliver_scheduled(self, items: list[dict]) -> None:
+        # The handle now firing is the oldest pending one
+        if self._deliver_handles:
+            self._deliver_handles.popleft()
+        self._deliver_batch(items)
+
     def set_delay(self, seconds: int) -> None:
         _apply_delay_handles_only(self, seconds, self._deliver_handles)
 
@@ -2665,16 +2904,10 @@ class RaceControlCoordinator(DataUpdateCoordinator):
         if reason == "init":
             return
         self._replay_mode = _is_replay_delay_reason(reason)
-        if self._replay_mode and self._deliver_handles:
-            for handle in list(self._deliver_handles):
-                with suppress(Exception):
-                    handle.cancel()
-            self._deliver_handles.clear()
+        if self._replay_mode:
+            _cancel_handles(self._deliver_handles)
         if _is_no_spoiler_live_state(reason):
-            for handle in list(self._deliver_handles):
-                with suppress(Exception):
-                    handle.cancel()
-            self._deliver_handles.clear()
+            _cancel_handles(self._deliver_handles)
             return
         self.available = is_live
         if not is_live:
@@ -2687,15 +2920,20 @@ class RaceControlCoordinator(DataUpdateCoordinator):
         # In replay mode, disable the startup cutoff so historical messages are accepted
         if is_live and reason == "replay":
             self._startup_cutoff = None
-            self._seen_ids_set.clear()
-            self._seen_ids_order.clear()
+            self._seen_ids.clear()
             _LOGGER.debug("RaceControl: disabled startup cutoff for replay mode")
 
+    def _deliver_batch(self, items: list[dict]) -> None:
+        # Listeners (live mode, sensor triggers) inspect every message, so each
+        # item is still published; only the loop scheduling is shared.
+        for item in items:
+            self._deliver(item)
+
     def _deliver(self, item: dict) -> None:
         if _is_no_spoiler_blocked(self):
             return
         self.available = True
-        received_at = dt_util.utcnow().isoformat(timespec="seconds")
+        received_at = _utcnow_iso_seconds()
         # Maintain last message for visibility and parity with other coordinators
         self._last_message = item
         self.data_list = [item]
@@ -2710,8 +2948,7 @@ class RaceControlCoordinator(DataUpdateCoordinator):
                 text = item.get("Message") or item.get("Text")
                 ts = item.get("Utc") or item.get("utc") or item.get("timestamp")
                 _LOGGER.debug(
-                    "RaceControl delivered at %s ts=%s cat=%s flag=%s text=%s",
-                    dt_util.utcnow().isoformat(timespec="seconds"),
+                    "RaceControl delivered ts=%s cat=%s flag=%s text=%s",
                     ts,
                     cat,
                     flag,
@@ -3242,18 +3479,7 @@ class LapCountCoordinator(DataUpdateCoordinator):
 
     @staticmethod
     def _parse_message(data):
-        if not isinstance(data, dict):
-            return None
-        messages = data.get("M")
-        if isinstance(messages, list):
-            for update in messages:
-                args = update.get("A", [])
-                if len(args) >= 2 and args[0] == "LapCount":
-                    return args[1]
-        result = data.get("R")
-        if isinstance(result, dict) and "LapCount" in result:
-            return result.get("LapCount")
-        return None
+        return _parse_signalr_message(data, "LapCount")
 
     def _on_bus_message(self, msg: dict) -> None:
         if not isinstance(msg, dict):
@@ -3263,6 +3489,10 @@ class LapCountCoordinator(DataUpdateCoordinator):
     def _deliver(self, msg: dict) -> None:
         if _is_no_spoiler_blocked(self):
             return
+        if self.available and msg == self.data:
+            # Repeat of the published payload; skip the listener fan-out
+            self._last_message = msg
+            return
         self.available = True
         self._last_message = msg
         self.data_list = [msg]
@@ -3270,8 +3500,7 @@ class LapCountCoordinator(DataUpdateCoordinator):
         if _LOGGER.isEnabledFor(logging.DEBUG):
             with suppress(Exception):
                 _LOGGER.debug(
-                    "LapCount delivered at %s current=%s total=%s",
-                    dt_util.utcnow().isoformat(timespec="seconds"),
+                    "LapCount delivered current=%s total=%s",
                     (msg or {}).get("CurrentLap") or (msg or {}).get("LapCount"),
                     (msg or {}).get("TotalLaps"),
                 )
@@ -3306,6 +3535,17 @@ class LapCountCoordinator(DataUpdateCoordinator):
             self.async_set_updated_data(self._last_message)
 
 
+@lru_cache(maxsize=1024)
+def _parse_int_text(text: str) -> int | None:
+    """Parse a stripped numeric string; lap and car numbers repeat constantly."""
+    try:
+        if text.isdigit():
+            return int(text)
+        return int(float(text))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
 class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
     """Coordinator aggregating live pit stops for all cars.
 
@@ -3350,23 +3590,21 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
         _init_delayed_ingest_state(self)
         self._delay = max(0, int(delay_seconds or 0))
         self._replay_mode = False
-        if delay_controller is not None:
-            self._delay_listener = delay_controller.add_listener(self.set_delay)
-        self._live_state_unsub: Callable[[], None] | None = None
-        if live_state is not None:
-            self._live_state_unsub = live_state.add_listener(self._handle_live_state)
 
         self._session_unsub: Callable[[], None] | None = None
-        self._session_fingerprint: str | None = None
+        self._session_fingerprint: bytes | None = None
+        self._session_fingerprint_payload: Any = None
 
         self._history_limit = min(
             PITSTOP_MAX_HISTORY_PER_CAR,
             max(1, int(history_limit or PITSTOP_MAX_HISTORY_PER_CAR)),
         )
-        self._by_car: dict[str, list[dict]] = {}
+        self._by_car: dict[str, deque[dict]] = {}
         self._dedup: set[tuple] = set()
         self._driver_map: dict[str, dict[str, Any]] = {}
         self._driver_pit_counts: dict[str, int] = {}
+        # Cars whose published entry must be rebuilt on the next delivery
+        self._changed_rns: set[str] = set()
         self._deliver_handle: asyncio.Handle | None = None
         self._drivers_coord = drivers_coordinator
 
@@ -3376,6 +3614,9 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
             "last_update": None,
             "last_reset": dt_util.utcnow().isoformat(timespec="seconds"),
         }
+        _attach_runtime_listeners(
+            self, delay_controller=delay_controller, live_state=live_state
+        )
 
     async def async_close(self, *_):
         _close_unsubs(self._unsubs)
@@ -3414,9 +3655,11 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
         _apply_delay_with_queue(self, seconds)
 
     def _reset_store(self) -> None:
+        self._deliver_handle = _cancel_handle(self._deliver_handle)
         self._by_car = {}
         self._dedup = set()
         self._driver_pit_counts = {}
+        self._changed_rns = set()
         self._state = {
             "total_stops": 0,
             "cars": {},
@@ -3436,9 +3679,7 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
             text = str(value).strip()
             if not text:
                 return None
-            if text.isdigit():
-                return int(text)
-            return int(float(text))
+            return _parse_int_text(text)
         except Exception:
             return None
 
@@ -3466,7 +3707,8 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
         ):
             return None
         parsed = int(text)
-        return str(parsed) if parsed > 0 else None
+        # Interned so every map and dedup key for a car shares one string
+        return intern(str(parsed)) if parsed > 0 else None
 
     @staticmethod
     def _bounded_text(value: Any) -> str | None:
@@ -3489,34 +3731,24 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
             return (rn, "ts", timestamp, pit_lane_time, pit_stop_time)
         return (rn, "no_ts", lap, pit_lane_time, pit_stop_time)
 
-    def _rebuild_pitstop_dedup(self) -> None:
-        keys: set[tuple[Any, ...]] = set()
-        for rn, stops in (self._by_car or {}).items():
-            if not isinstance(stops, list):
-                continue
-            for stop in stops:
-                if not isinstance(stop, dict):
-                    continue
-                keys.add(
-                    self._dedup_key(
-                        str(rn),
-                        self._parse_int(stop.get("lap")),
-                        self._bounded_text(stop.get("timestamp")),
-                        self._parse_float(stop.get("pit_lane_time")),
-                        self._parse_float(stop.get("pit_stop_time")),
-                    )
-                )
-        self._dedup = keys
+    def _stop_dedup_key(self, rn: str, stop: dict) -> tuple[Any, ...]:
+        return self._dedup_key(
+            rn,
+            self._parse_int(stop.get("lap")),
+            self._bounded_text(stop.get("timestamp")),
+            self._parse_float(stop.get("pit_lane_time")),
+            self._parse_float(stop.get("pit_stop_time")),
+        )
 
     def _schedule_deliver(self) -> None:
-        self._deliver()
+        _schedule_coalesced_deliver(self)
 
-    def _add_stop(self, racing_number: str, stop: dict) -> None:
+    def _add_stop(self, racing_number: str, stop: dict) -> bool:
         rn = self._normalize_racing_number(racing_number)
         if rn is None:
-            return
+            return False
         if rn not in self._by_car and len(self._by_car) >= PITSTOP_MAX_CARS:
-            return
+            return False
         lap = self._parse_int(stop.get("lap"))
         ts = self._bounded_text(stop.get("timestamp"))
         pit_stop_time = self._parse_float(stop.get("pit_stop_time"))
@@ -3525,7 +3757,7 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
         # Dedup: prefer timestamp when present, else fall back to lap/times.
         key = self._dedup_key(rn, lap, ts, pit_lane_time, pit_stop_time)
         if key in self._dedup:
-            return
+            return False
         self._dedup.add(key)
 
         entry = {
@@ -3535,17 +3767,23 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
             "pit_lane_time": pit_lane_time,
             "pit_delta": None,
         }
-        self._maybe_update_pit_delta(rn, entry)
-        lst = self._by_car.setdefault(rn, [])
-        lst.append(entry)
-        if len(lst) > self._history_limit:
-            self._by_car[rn] = lst[-self._history_limit :]
-            self._rebuild_pitstop_dedup()
-
-    def _ingest_pitstopseries(self, msg: dict) -> None:
+        self._maybe_update_pit_delta(rn, entry, self._get_lap_history(rn))
+        stops = self._by_car.get(rn)
+        if stops is None:
+            stops = self._by_car[rn] = deque(maxlen=self._history_limit)
+        elif len(stops) == stops.maxlen:
+            # append() drops the oldest stop; forget its dedup key as well
+            self._dedup.discard(self._stop_dedup_key(rn, stops[0]))
+        stops.append(entry)
+        self._changed_rns.add(rn)
+        return True
+
+    def _ingest_pitstopseries(self, msg: dict) -> bool:
+        """Store new stops from a PitStopSeries frame; return True if any were added."""
         pit_times = (msg or {}).get("PitTimes")
         if not isinstance(pit_times, dict):
-            return
+            return False
+        added = False
         processed_entries = 0
         for car_index, (rn, entries) in enumerate(pit_times.items()):
             if car_index >= PITSTOP_MAX_CARS_PER_PAYLOAD:
@@ -3567,7 +3805,7 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
                 pitstop = item.get("PitStop")
                 if not isinstance(pitstop, dict):
                     continue
-                self._add_stop(
+                if self._add_stop(
                     pitstop.get("RacingNumber") or rn,
                     {
                         "lap": pitstop.get("Lap"),
@@ -3575,7 +3813,9 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
                         "pit_stop_time": pitstop.get("PitStopTime"),
                         "pit_lane_time": pitstop.get("PitLaneTime"),
                     },
-                )
+                ):
+                    added = True
+        return added
 
     def _on_driverlist(self, payload: dict) -> None:
         """Merge DriverList into an rn -> {tla,name,team} mapping."""
@@ -3589,13 +3829,16 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
             )
             if racing_number is None:
                 continue
-            self._driver_map[racing_number] = {
+            identity = {
                 "tla": self._bounded_text(info.get("Tla")),
                 "name": self._bounded_text(
                     info.get("FullName") or info.get("BroadcastName")
                 ),
                 "team": self._bounded_text(info.get("TeamName")),
             }
+            if self._driver_map.get(racing_number) != identity:
+                self._driver_map[racing_number] = identity
+                self._changed_rns.add(racing_number)
 
     def _seed_driver_map_from_ergast(self) -> None:
         """Fallback identity mapping using Ergast/Jolpica driver standings.
@@ -3612,42 +3855,40 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
     def _on_bus_pitstopseries(self, msg: dict) -> None:
         if not isinstance(msg, dict):
             return
-        self._ingest_pitstopseries(msg)
-        self._schedule_deliver()
+        # Frames that only repeat known stops leave the published state as is
+        if self._ingest_pitstopseries(msg):
+            self._schedule_deliver()
 
     def _deliver(self) -> None:
         if _is_no_spoiler_blocked(self):
             return
-        self._refresh_pit_deltas()
         cars: dict[str, Any] = {}
         total = 0
         try:
-            car_numbers: set[str] = set()
-            for rn in self._by_car or {}:
-                normalized = self._normalize_racing_number(rn)
-                if normalized is not None:
-                    car_numbers.add(normalized)
-            for rn, count in (self._driver_pit_counts or {}).items():
-                normalized = self._normalize_racing_number(rn)
-                if normalized is not None and int(count or 0) > 0:
-                    car_numbers.add(normalized)
-            sorted_car_numbers = sorted(car_numbers, key=int)[:PITSTOP_MAX_CARS]
-            for rn, stops in sorted(
-                ((rn, self._by_car.get(rn, [])) for rn in sorted_car_numbers),
-                key=lambda kv: int(str(kv[0])),
-            ):
-                lst = list(stops or [])
-                fallback_count = int(self._driver_pit_counts.get(str(rn), 0))
-                stop_count = max(len(lst), fallback_count)
-                ident = self._get_identity(str(rn))
-                cars[str(rn)] = {
-                    "tla": ident.get("tla"),
-                    "name": ident.get("name"),
-                    "team": ident.get("team"),
-                    "count": stop_count,
-                    "stops": lst,
-                }
-                total += stop_count
+            # Both maps are keyed by normalized racing numbers already
+            car_numbers = set(self._by_car)
+            car_numbers.update(
+                rn for rn, count in self._driver_pit_counts.items() if count > 0
+            )
+            # Reuse the published entry of every car that did not change
+            prev_cars = self._state.get("cars") or {}
+            changed = self._changed_rns
+            for rn in sorted(car_numbers, key=int)[:PITSTOP_MAX_CARS]:
+                car = prev_cars.get(rn)
+                if car is None or rn in changed:
+                    lst = list(self._by_car.get(rn) or [])
+                    fallback_count = int(self._driver_pit_counts.get(rn, 0))
+                    ident = self._get_identity(rn)
+                    car = {
+                        "tla": ident.get("tla"),
+                        "name": ident.get("name"),
+                        "team": ident.get("team"),
+                        "count": max(len(lst), fallback_count),
+                        "stops": lst,
+                    }
+                cars[rn] = car
+                total += car["count"]
+            self._changed_rns = set()
         except Exception:
             cars = {}
             combined: dict[str, list[dict[str, Any]]] = {}
@@ -3674,11 +3915,13 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
                 )
             except Exception:
                 total = 0
+            # Fallback entries lack identity; rebuild them next time
+            self._changed_rns.update(cars)
 
         self._state = {
             "total_stops": int(total),
             "cars": cars,
-            "last_update": dt_util.utcnow().isoformat(timespec="seconds"),
+            "last_update": _utcnow_iso_seconds(),
             "last_reset": self._state.get("last_reset"),
         }
         self.async_set_updated_data(self._state)
@@ -3689,9 +3932,7 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
         self._seed_driver_map_from_ergast()
         # Reset when LiveTiming index changes (session/weekend rollover)
         try:
-            self._session_fingerprint = _compute_session_fingerprint(
-                getattr(self._session_coord, "data", None)
-            )
+            self._prime_session_fingerprint()
             self._session_unsub = self._session_coord.async_add_listener(
                 self._on_session_index_update
             )
@@ -3719,86 +3960,76 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
                 )
             except Exception:
                 self._drivers_unsub = None
-        seeded = self._refresh_pit_counts_from_coordinator()
-        if self._refresh_driver_map_from_coordinator():
-            seeded = True
-        if self._refresh_pit_deltas():
-            seeded = True
-        if seeded:
+        if self._refresh_from_drivers_coordinator():
             self._schedule_deliver()
 
     def _on_drivers_update(self) -> None:
-        changed = self._refresh_pit_counts_from_coordinator()
-        if self._refresh_pit_deltas():
-            changed = True
-        if self._refresh_driver_map_from_coordinator():
-            changed = True
-        if changed:
+        if self._refresh_from_drivers_coordinator():
             self._schedule_deliver()
 
-    def _refresh_pit_counts_from_coordinator(self) -> bool:
+    def _coordinator_drivers(self) -> dict[str, Any] | None:
         if not self._drivers_coord:
-            return False
+            return None
         data = self._drivers_coord.data
         if not isinstance(data, dict):
-            return False
+            return None
         drivers = data.get("drivers")
-        if not isinstance(drivers, dict):
-            return False
-        next_counts: dict[str, int] = {}
-        for rn, info in drivers.items():
-            if len(next_counts) >= PITSTOP_MAX_CARS:
-                break
-            if not isinstance(info, dict):
-                continue
-            normalized = self._normalize_racing_number(rn)
-            if normalized is None:
-                continue
-            timing = info.get("timing")
-            if not isinstance(timing, dict):
-                continue
-            pit_stops = self._parse_int(timing.get("pit_stops"))
-            if pit_stops is None:
-                continue
-            next_counts[normalized] = max(0, pit_stops)
-        if next_counts == self._driver_pit_counts:
-            return False
-        self._driver_pit_counts = next_counts
-        return True
+        return drivers if isinstance(drivers, dict) else None
 
-    def _refresh_driver_map_from_coordinator(self) -> bool:
-        updated = False
-        if not self._drivers_coord:
-            return False
-        data = self._drivers_coord.data
-        if not isinstance(data, dict):
-            return False
-        drivers = data.get("drivers")
-        if not isinstance(drivers, dict):
+    def _refresh_from_drivers_coordinator(self) -> bool:
+        """Apply pit counts, identities and pit deltas in one drivers pass."""
+        drivers = self._coordinator_drivers()
+        if drivers is None:
             return False
+        changed = False
+        next_counts: dict[str, int] = {}
+        driver_map = self._driver_map
+        by_car = self._by_car
         for rn, info in drivers.items():
             if not isinstance(info, dict):
                 continue
             key = self._normalize_racing_number(rn)
             if key is None:
                 continue
+            timing = info.get("timing")
+            if len(next_counts) < PITSTOP_MAX_CARS and isinstance(timing, dict):
+                pit_stops = self._parse_int(timing.get("pit_stops"))
+                if pit_stops is not None:
+                    next_counts[key] = max(0, pit_stops)
             identity = info.get("identity")
-            if not isinstance(identity, dict):
-                continue
-            entry = self._driver_map.setdefault(key, {})
-            new_tla = self._bounded_text(identity.get("tla"))
-            new_name = self._bounded_text(identity.get("name"))
-            new_team = self._bounded_text(identity.get("team"))
-            if new_tla and entry.get("tla") != new_tla:
-                entry["tla"] = new_tla
-                updated = True
-            if new_name and entry.get("name") != new_name:
-                entry["name"] = new_name
-                updated = True
-            if new_team and entry.get("team") != new_team:
-                entry["team"] = new_team
-                updated = True
-        return updated
+            if isinstance(identity, dict):
+                entry = driver_map.setdefault(key, {})
+                current = (entry.get("tla"), entry.get("name"), entry.get("team"))
+                # Empty values from the drivers feed never clear a known identity
+                merged = (
+                    self._bounded_text(identity.get("tla")) or current[0],
+                    self._bounded_text(identity.get("name")) or current[1],
+                    self._bounded_text(identity.get("team")) or current[2],
+                )
+                if merged != current:
+                    entry["tla"], entry["name"], entry["team"] = merged
+                    self._changed_rns.add(key)
+                    changed = True
+            stops = by_car.get(key)
+            if stops:
+                # Resolve the car's lap history once for all of its stops
+                laps = self._lap_history_from(drivers, rn)
+                for stop in stops:
+                    if isinstance(stop, dict) and self._maybe_update_pit_delta(
+                        key, stop, laps
+                    ):
+                        self._changed_rns.add(key)
+                        changed = True
+        if next_counts != self._driver_pit_counts:
+            previous = self._driver_pit_counts
+            self._changed_rns.update(
+                rn
+                for rn in next_counts.keys() | previous.keys()
+                if next_counts.get(rn) != previous.get(rn)
+            )
+            self._driver_pit_counts = next_counts
+            changed = True
+        return changed
 
     def _get_identity(self, rn: str) -> dict[str, Any]:
         ident = (
@@ -3808,13 +4039,8 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
         )
         if ident.get("tla") or ident.get("name") or ident.get("team"):
             return ident
-        if not self._drivers_coord:
-            return ident
-        data = self._drivers_coord.data
-        if not isinstance(data, dict):
-            return ident
-        drivers = data.get("drivers")
-        if not isinstance(drivers, dict):
+        drivers = self._coordinator_drivers()
+        if drivers is None:
             return ident
         info = drivers.get(str(rn))
         if not isinstance(info, dict):
@@ -3828,36 +4054,22 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
             "team": self._bounded_text(identity.get("team")),
         }
 
-    def _refresh_pit_deltas(self) -> bool:
-        changed = False
-        if not self._drivers_coord:
-            return False
-        for rn, stops in (self._by_car or {}).items():
-            if not isinstance(stops, list):
-                continue
-            for stop in stops:
-                if not isinstance(stop, dict):
-                    continue
-                if self._maybe_update_pit_delta(str(rn), stop):
-                    changed = True
-        return changed
-
-    def _maybe_update_pit_delta(self, rn: str, stop: dict) -> bool:
+    def _maybe_update_pit_delta(
+        self, rn: str, stop: dict, laps: dict[str, str] | None
+    ) -> bool:
         if stop.get("pit_delta") is not None:
             return False
-        delta = self._compute_pit_delta(rn, stop)
+        delta = self._compute_pit_delta(stop, laps)
         if delta is None:
             with suppress(Exception):
                 lap = self._parse_int(stop.get("lap"))
-                if lap is not None:
-                    laps = self._get_lap_history(rn) or {}
-                    if str(lap + 1) not in laps:
-                        _LOGGER.debug(
-                            "Pit delta pending for %s (lap %s): waiting for lap %s time",
-                            rn,
-                            lap,
-                            lap + 1,
-                        )
+                if lap is not None and str(lap + 1) not in (laps or {}):
+                    _LOGGER.debug(
+                        "Pit delta pending for %s (lap %s): waiting for lap %s time",
+                        rn,
+                        lap,
+                        lap + 1,
+                    )
             return False
         stop["pit_delta"] = delta
         with suppress(Exception):
@@ -3870,11 +4082,12 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
             )
         return True
 
-    def _compute_pit_delta(self, rn: str, stop: dict) -> float | None:
+    def _compute_pit_delta(
+        self, stop: dict, laps: dict[str, str] | None
+    ) -> float | None:
         lap = self._parse_int(stop.get("lap"))
         if lap is None:
             return None
-        laps = self._get_lap_history(rn)
         if not laps:
             return None
         pit_secs = self._select_pit_lap_secs(laps, lap)
@@ -3886,24 +4099,19 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
         return round(pit_secs - normal_secs, 3)
 
     def _get_lap_history(self, rn: str) -> dict[str, str] | None:
-        if not self._drivers_coord:
-            return None
-        data = self._drivers_coord.data
-        if not isinstance(data, dict):
-            return None
-        drivers = data.get("drivers")
-        if not isinstance(drivers, dict):
-            return None
-        info = drivers.get(str(rn))
-        if not isinstance(info, dict):
-            return None
-        lap_history = info.get("lap_history")
-        if not isinstance(lap_history, dict):
+        drivers = self._coordinator_drivers()
+        if drivers is None:
             return None
-        laps = lap_history.get("laps")
-        if not isinstance(laps, dict):
+        return self._lap_history_from(drivers, rn)
+
+    @staticmethod
+    def _lap_history_from(drivers: dict[str, Any], rn: str) -> dict[str, str] | None:
+        # Lap history is normally present; only the first laps miss it
+        try:
+            laps = drivers[rn]["lap_history"]["laps"]
+        except (KeyError, TypeError, IndexError):
             return None
-        return laps
+        return laps if isinstance(laps, dict) else None
 
     @staticmethod
     def _select_pit_lap_secs(laps: dict[str, str], lap: int) -> float | None:
@@ -3912,7 +4120,7 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
             return None
         candidates: list[float] = []
         for lap_time in (laps.get(str(lap)), next_lap_time):
-            lap_secs = LiveDriversCoordinator._parse_laptime_secs(lap_time)
+            lap_secs = _parse_laptime_secs(lap_time)
             if lap_secs is not None:
                 candidates.append(lap_secs)
         if not candidates:
@@ -3921,25 +4129,33 @@ class PitStopCoordinator(_SessionFingerprintMixin, DataUpdateCoordinator):
 
     @staticmethod
     def _select_reference_lap_secs(laps: dict[str, str], lap: int) -> float | None:
-        candidates: list[float] = []
-        for offset in (1, 2, 3):
-            lap_time = laps.get(str(lap - offset))
-            lap_secs = LiveDriversCoordinator._parse_laptime_secs(lap_time)
-            if lap_secs is not None:
-                candidates.append(lap_secs)
-        if not candidates:
-            for offset in (2, 3, 4):
-                lap_time = laps.get(str(lap + offset))
-                lap_secs = LiveDriversCoordinator._parse_laptime_secs(lap_time)
-                if lap_secs is not None:
-                    candidates.append(lap_secs)
+        # Prefer the three laps before the stop, else the clean laps after it
+        candidates = [
+            secs
+            for secs in (
+                _parse_laptime_secs(laps.get(str(lap - 1))),
+                _parse_laptime_secs(laps.get(str(lap - 2))),
+                _parse_laptime_secs(laps.get(str(lap - 3))),
+            )
+            if secs is not None
+        ]
         if not candidates:
-            return None
-        candidates.sort()
-        mid = len(candidates) // 2
-        if len(candidates) % 2 == 1:
-            return candidates[mid]
-        return (candidates[mid - 1] + candidates[mid]) / 2.0
+            candidates = [
+                secs
+                for secs in (
+                    _parse_laptime_secs(laps.get(str(lap + 2))),
+                    _parse_laptime_secs(laps.get(str(lap + 3))),
+                    _parse_laptime_secs(laps.get(str(lap + 4))),
+                )
+                if secs is not None
+            ]
+        # Median of at most three samples without sorting
+        if len(candidates) == 3:
+            a, b, c = candidates
+            return max(min(a, b), min(max(a, b), c))
+        if len(candidates) == 2:
+            return (candidates[0] + candidates[1]) / 2.0
+        return candidates[0] if candidates else None
 
 
 class ChampionshipPredictionCoordinator(
@@ -3985,18 +4201,16 @@ class ChampionshipPredictionCoordinator(
         _init_delayed_ingest_state(self)
         self._delay = max(0, int(delay_seconds or 0))
         self._replay_mode = False
-        if delay_controller is not None:
-            self._delay_listener = delay_controller.add_listener(self.set_delay)
-
-        self._live_state_unsub: Callable[[], None] | None = None
-        if live_state is not None:
-            self._live_state_unsub = live_state.add_listener(self._handle_live_state)
 
         self._session_unsub: Callable[[], None] | None = None
-        self._session_fingerprint: str | None = None
+        self._session_fingerprint: bytes | None = None
+        self._session_fingerprint_payload: Any = None
 
         self._drivers: dict[str, dict[str, Any]] = {}
         self._teams: dict[str, dict[str, Any]] = {}
+        # Parsed PredictedPosition per entry, kept in step with the merges
+        self._driver_pos: dict[str, int] = {}
+        self._team_pos: dict[str, int] = {}
         self._driver_map: dict[str, dict[str, Any]] = {}
 
         self._deliver_handle: asyncio.Handle | None = None
@@ -4017,6 +4231,9 @@ class ChampionshipPredictionCoordinator(
             },
             "last_update": None,
         }
+        _attach_runtime_listeners(
+            self, delay_controller=delay_controller, live_state=live_state
+        )
 
     async def async_close(self, *_):
         _close_unsubs(self._unsubs)
@@ -4054,8 +4271,11 @@ class ChampionshipPredictionCoordinator(
         _apply_delay_with_queue(self, seconds)
 
     def _reset_store(self) -> None:
+        self._deliver_handle = _cancel_handle(self._deliver_handle)
         self._drivers = {}
         self._teams = {}
+        self._driver_pos = {}
+        self._team_pos = {}
         self._state = {
             "drivers": {},
             "teams": {},
@@ -4077,49 +4297,70 @@ class ChampionshipPredictionCoordinator(
             self.async_set_updated_data(self._state)
 
     def _schedule_deliver(self) -> None:
-        self._deliver()
+        # Coalesce a burst of frames into a single rebuild on the next loop pass
+        _schedule_coalesced_deliver(self, always=True)
 
     @staticmethod
     def _deep_merge(dst: dict[str, Any], src: dict[str, Any]) -> dict[str, Any]:
-        """Shallow/deep merge dicts: nested dicts are merged recursively."""
+        """Shallow/deep merge dicts: nested dicts are merged in place."""
         if not isinstance(dst, dict):
             dst = {}
-        for k, v in (src or {}).items():
-            if isinstance(v, dict) and isinstance(dst.get(k), dict):
-                dst[k] = ChampionshipPredictionCoordinator._deep_merge(
-                    dst.get(k) or {}, v
-                )
-            else:
-                dst[k] = v
+        if not src:
+            return dst
+        # Most prediction patches are flat scalar updates
+        if not any(isinstance(v, dict) for v in src.values()):
+            dst.update(src)
+            return dst
+        stack = [(dst, src)]
+        while stack:
+            target, patch = stack.pop()
+            for k, v in patch.items():
+                current = target.get(k)
+                if isinstance(v, dict) and isinstance(current, dict):
+                    stack.append((current, v))
+                else:
+                    target[k] = v
         return dst
 
-    def _ingest_prediction(self, msg: dict) -> None:
+    def _ingest_prediction(self, msg: dict) -> bool:
+        """Merge a prediction patch; return True if any entry was updated."""
         if not isinstance(msg, dict):
-            return
+            return False
         drivers = msg.get("Drivers")
+        teams = msg.get("Teams")
+        if not drivers and not teams:
+            return False
+        merged = False
         if isinstance(drivers, dict):
             for key, patch in drivers.items():
                 if not isinstance(patch, dict):
                     continue
-                rn = str(patch.get("RacingNumber") or key).strip()
+                rn = patch.get("RacingNumber") or key
+                rn = intern((rn if isinstance(rn, str) else str(rn)).strip())
                 if not rn:
                     continue
                 cur = self._drivers.get(rn) or {}
                 # Ensure RacingNumber is stable
                 cur.setdefault("RacingNumber", rn)
                 self._drivers[rn] = self._deep_merge(cur, patch)
+                self._track_position(self._driver_pos, rn, self._drivers[rn])
+                merged = True
 
-        teams = msg.get("Teams")
         if isinstance(teams, dict):
             for team_key, patch in teams.items():
                 if not isinstance(patch, dict):
                     continue
-                tk = str(team_key).strip()
+                tk = intern(
+                    (team_key if isinstance(team_key, str) else str(team_key)).strip()
+                )
                 if not tk:
                     continue
                 cur = self._teams.get(tk) or {}
                 cur.setdefault("TeamKey", tk)
                 self._teams[tk] = self._deep_merge(cur, patch)
+                self._track_position(self._team_pos, tk, self._teams[tk])
+                merged = True
+        return merged
 
     def _on_driverlist(self, payload: dict) -> None:
         if not isinstance(payload, dict):
@@ -4150,67 +4391,30 @@ class ChampionshipPredictionCoordinator(
             self._driver_map,
         )
 
-    @staticmethod
-    def _to_int(value: Any) -> int | None:
-        try:
-            if value is None:
-                return None
-            if isinstance(value, int):
-                return value
-            text = str(value).strip()
-            if not text:
-                return None
-            if text.isdigit():
-                return int(text)
-            return int(float(text))
-        except Exception:
-            return None
-
-    @staticmethod
-    def _to_float(value: Any) -> float | None:
-        try:
-            if value is None:
-                return None
-            if isinstance(value, (int, float)):
-                return float(value)
-            text = str(value).strip()
-            if not text:
-                return None
-            return float(text)
-        except Exception:
-            return None
+    def _track_position(
+        self, positions: dict[str, int], key: str, entry: dict[str, Any]
+    ) -> None:
+        pos = _coerce_int(entry.get("PredictedPosition"))
+        if pos is None:
+            positions.pop(key, None)
+        else:
+            positions[key] = pos
 
     def _pick_predicted_driver_p1(self) -> tuple[str | None, dict | None]:
-        best_rn = None
-        best_entry = None
-        best_pos = None
-        for rn, entry in (self._drivers or {}).items():
-            if not isinstance(entry, dict):
-                continue
-            pos = self._to_int(entry.get("PredictedPosition"))
-            if pos is None:
-                continue
-            if best_pos is None or pos < best_pos:
-                best_pos = pos
-                best_rn = str(entry.get("RacingNumber") or rn)
-                best_entry = entry
-        return best_rn, best_entry
+        positions = self._driver_pos
+        if not positions:
+            return None, None
+        rn = min(positions, key=positions.__getitem__)
+        entry = self._drivers[rn]
+        return str(entry.get("RacingNumber") or rn), entry
 
     def _pick_predicted_team_p1(self) -> tuple[str | None, dict | None]:
-        best_key = None
-        best_entry = None
-        best_pos = None
-        for key, entry in (self._teams or {}).items():
-            if not isinstance(entry, dict):
-                continue
-            pos = self._to_int(entry.get("PredictedPosition"))
-            if pos is None:
-                continue
-            if best_pos is None or pos < best_pos:
-                best_pos = pos
-                best_key = str(entry.get("TeamKey") or key)
-                best_entry = entry
-        return best_key, best_entry
+        positions = self._team_pos
+        if not positions:
+            return None, None
+        key = min(positions, key=positions.__getitem__)
+        entry = self._teams[key]
+        return str(entry.get("TeamKey") or key), entry
 
     def _deliver(self) -> None:
         if _is_no_spoiler_blocked(self):
@@ -4220,7 +4424,7 @@ class ChampionshipPredictionCoordinator(
         ident = self._driver_map.get(str(p1_rn), {}) if p1_rn else {}
         p1_tla = ident.get("tla") if isinstance(ident, dict) else None
         p1_pts = (
-            self._to_float((p1_entry or {}).get("PredictedPoints"))
+            _coerce_float((p1_entry or {}).get("PredictedPoints"))
             if isinstance(p1_entry, dict)
             else None
         )
@@ -4232,7 +4436,7 @@ class ChampionshipPredictionCoordinator(
         if not team_name and t1_key:
             team_name = str(t1_key)
         t1_pts = (
-            self._to_float((t1_entry or {}).get("PredictedPoints"))
+            _coerce_float((t1_entry or {}).get("PredictedPoints"))
             if isinstance(t1_entry, dict)
             else None
         )
@@ -4252,15 +4456,15 @@ class ChampionshipPredictionCoordinator(
                 "points": t1_pts,
                 "entry": dict(t1_entry) if isinstance(t1_entry, dict) else None,
             },
-            "last_update": dt_util.utcnow().isoformat(timespec="seconds"),
+            "last_update": _utcnow_iso_seconds(),
         }
         self.async_set_updated_data(self._state)
 
     def _on_bus_message(self, msg: dict) -> None:
         if not isinstance(msg, dict):
             return
-        self._ingest_prediction(msg)
-        self._schedule_deliver()
+        if self._ingest_prediction(msg):
+            self._schedule_deliver()
 
     async def async_config_entry_first_refresh(self):
         await super().async_config_entry_first_refresh()
@@ -4268,9 +4472,7 @@ class ChampionshipPredictionCoordinator(
         self._seed_driver_map_from_ergast()
         # Reset on index/session rollover
         try:
-            self._session_fingerprint = _compute_session_fingerprint(
-                getattr(self._session_coord, "data", None)
-            )
+            self._prime_session_fingerprint()
             self._session_unsub = self._session_coord.async_add_listener(
                 self._on_session_index_update
             )
@@ -4293,6 +4495,106 @@ class ChampionshipPredictionCoordinator(
             )
 
 
+def _parse_laptime_secs(value: str | None) -> float | None:
+    """Parse a lap time formatted like 'M:SS.mmm' or 'SS.mmm' to seconds."""
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_laptime_text(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_laptime_text(value: str) -> float | None:
+    # Lap time strings recur across last/best lap, stints and history rescans
+    try:
+        s = value.strip()
+        if ":" in s:
+            minutes_str, sec_str = s.split(":", 1)
+            minutes = int(minutes_str)
+            seconds = float(sec_str)
+            return minutes * 60.0 + seconds
+        return float(s)
+    except ValueError:
+        return None
+
+
+_COMPOUND_ALIASES: dict[str, str] = {
+    "INTER": "INTERMEDIATE",
+    "INTERS": "INTERMEDIATE",
+    "INTERMEDIATES": "INTERMEDIATE",
+    "WETS": "WET",
+    "FULLWET": "WET",
+    "FULL WET": "WET",
+    "FULL_WET": "WET",
+}
+
+
+_COMPOUND_SORT_ORDER: dict[str, int] = {
+    "SOFT": 0,
+    "MEDIUM": 1,
+    "HARD": 2,
+    "INTERMEDIATE": 3,
+    "WET": 4,
+}
+
+
+@lru_cache(maxsize=64)
+def _normalize_compound_text(value: str) -> str | None:
+    comp = value.strip().upper()
+    if not comp:
+        return None
+    return intern(_COMPOUND_ALIASES.get(comp, comp))
+
+
+@lru_cache(maxsize=64)
+def _normalize_team_color_text(value: str) -> str:
+    if value.startswith("#"):
+        return value
+    return f"#{value}"
+
+
+def _normalize_compound_value(value: Any) -> str | None:
+    if not isinstance(value, str):
+        return value if value is None else str(value)
+    return _normalize_compound_text(value)
+
+
+def _stint_lap_count(value: Any) -> int | None:
+    # Same acceptance as str(value or "").isdigit(), without building a string
+    # for the native ints the feed sends (falsy values still count as missing).
+    if type(value) is int:
+        return value if value > 0 else None
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
+    return None
+
+
+def _stint_total_laps(value: Any) -> int:
+    laps = _stint_lap_count(value)
+    return 0 if laps is None else laps
+
+
+def _stint_start_laps(value: Any) -> int | None:
+    return _stint_lap_count(value)
+
+
+def _stint_new_flag(value: Any) -> Any:
+    text = str(value).lower()
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+    return value
+
+
+# TimingAppData stint keys -> (stored field, coercer), applied only when present
+_STINT_FIELDS: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("Compound", "compound", _normalize_compound_value),
+    ("TotalLaps", "total_laps", _stint_total_laps),
+    ("StartLaps", "start_laps", _stint_start_laps),
+    ("New", "new", _stint_new_flag),
+)
+
+
 class LiveDriversCoordinator(DataUpdateCoordinator):
     """Coordinator aggregating DriverList, TimingData, TimingAppData, LapCount and SessionStatus.
 
@@ -4378,6 +4680,11 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
             "tyre_statistics": {},
             "fastest_lap": self._empty_fastest_lap(),
         }
+        # Numeric running position per racing number, kept in step with
+        # timing["position"] so leader lookups avoid reparsing every driver.
+        self._position_index: dict[str, int] = {}
+        # Last HeadshotUrl per racing number with its transform-stripped form
+        self._headshot_cache: dict[str, tuple[str, str]] = {}
         self._live_state_unsub: Callable[[], None] | None = None
         if live_state is not None:
             self._live_state_unsub = live_state.add_listener(self._handle_live_state)
@@ -4404,6 +4711,26 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self):
         return self._state
 
+    @staticmethod
+    def _driver_entry(drivers: dict[str, Any], rn: str) -> dict[str, Any]:
+        """Return the stored entry for ``rn``, creating a complete one if missing."""
+        entry = drivers.get(rn)
+        if entry is None:
+            entry = drivers[rn] = {
+                "identity": {},
+                "timing": {},
+                "tyres": {},
+                "laps": {},
+                "tyre_history": {"stints": [], "current_stint_index": None},
+                "lap_history": {
+                    "laps": {},
+                    "last_recorded_lap": 0,
+                    "grid_position": None,
+                    "completed_laps": 0,
+                },
+            }
+        return entry
+
     def _merge_driverlist(self, payload: dict) -> bool:
         # payload: { rn: {Tla, FullName, TeamName, TeamColour, ...}, ... }
         drivers = self._state["drivers"]
@@ -4411,23 +4738,20 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         for rn, info in (payload or {}).items():
             if not isinstance(info, dict):
                 continue
-            rn_key = str(rn)
+            # SignalR keys are already strings; only coerce anything else once
+            rn_key = rn if type(rn) is str else str(rn)
             # Derive headshot URLs in both small (transform) and large (original) forms
             headshot_raw = info.get("HeadshotUrl")
             headshot_small = headshot_raw if isinstance(headshot_raw, str) else None
             headshot_large = headshot_small
-            try:
-                if isinstance(headshot_raw, str):
-                    idx = headshot_raw.find(".transform/")
-                    if idx != -1:
-                        headshot_large = headshot_raw[:idx]
-            except Exception:
-                headshot_large = headshot_small
-            ident = drivers.setdefault(rn_key, {})
-            ident.setdefault("identity", {})
-            ident.setdefault("timing", {})
-            ident.setdefault("tyres", {})
-            ident.setdefault("laps", {})
+            if headshot_small is not None:
+                cached = self._headshot_cache.get(rn_key)
+                if cached is not None and cached[0] == headshot_small:
+                    headshot_large = cached[1]
+                else:
+                    headshot_large = headshot_small.partition(".transform/")[0]
+                    self._headshot_cache[rn_key] = (headshot_small, headshot_large)
+            ident = self._driver_entry(drivers, rn_key)
             identity_updates: dict[str, Any] = {}
             if "RacingNumber" in info or "racing_number" not in ident["identity"]:
                 identity_updates["racing_number"] = str(
@@ -4453,15 +4777,12 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
             if "Reference" in info:
                 identity_updates["reference"] = info.get("Reference")
 
-            if identity_updates:
-                driver_changed = False
-                for key, value in identity_updates.items():
-                    if ident["identity"].get(key) != value:
-                        driver_changed = True
-                        break
-                if driver_changed:
-                    ident["identity"].update(identity_updates)
-                    changed = True
+            # Subset test on the item views runs in C and stops at the first miss
+            if identity_updates and not (
+                identity_updates.items() <= ident["identity"].items()
+            ):
+                ident["identity"].update(identity_updates)
+                changed = True
 
             fastest = self._state.get("fastest_lap")
             if isinstance(fastest, dict) and fastest.get("racing_number") == rn_key:
@@ -4486,15 +4807,6 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
                 except (TypeError, ValueError):
                     line_pos = None
                 if line_pos is not None:
-                    ident.setdefault(
-                        "lap_history",
-                        {
-                            "laps": {},
-                            "last_recorded_lap": 0,
-                            "grid_position": None,
-                            "completed_laps": 0,
-                        },
-                    )
                     lap_history = ident["lap_history"]
                     if (
                         lap_history.get("grid_position") is None
@@ -4565,49 +4877,40 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
             return False
 
         drivers = self._state["drivers"]
-        entry = drivers.setdefault(rn, {})
-        entry.setdefault("identity", {})
-        entry.setdefault("timing", {})
-        entry.setdefault("tyres", {})
-        entry.setdefault("laps", {})
-        entry.setdefault("tyre_history", {"stints": [], "current_stint_index": None})
-        entry.setdefault(
-            "lap_history",
-            {
-                "laps": {},
-                "last_recorded_lap": 0,
-                "grid_position": None,
-                "completed_laps": 0,
-            },
-        )
+        entry = self._driver_entry(drivers, rn)
 
         changed = False
         timing = entry["timing"]
+        # A repeated lap time cannot improve the session best lap, so only a
+        # new value pays for the comparison. History and stint stats still
+        # run: the stint may have opened after the time first arrived.
         if timing.get("last_lap") != lap_time:
             timing["last_lap"] = lap_time
             changed = True
-
-        prev_best = timing.get("best_lap")
-        new_secs = self._parse_laptime_secs(lap_time)
-        prev_secs = (
-            self._parse_laptime_secs(prev_best) if isinstance(prev_best, str) else None
-        )
-        if new_secs is not None and (prev_secs is None or new_secs < prev_secs):
-            timing["best_lap"] = lap_time
-            changed = True
+            prev_best = timing.get("best_lap")
+            new_secs = _parse_laptime_secs(lap_time)
+            prev_secs = (
+                _parse_laptime_secs(prev_best) if isinstance(prev_best, str) else None
+            )
+            if new_secs is not None and (prev_secs is None or new_secs < prev_secs):
+                timing["best_lap"] = lap_time
 
         if self._record_lap_for_history(rn, lap_time, lap_num):
             changed = True
         if self._record_lap_time_for_stint(rn, lap_time):
             changed = True
-
         return changed
 
     def _merge_timingdata(self, payload: dict) -> bool:
         # payload: {"Lines": { rn: {...timing...} } }
-        lines = (payload or {}).get("Lines", {})
+        if not isinstance(payload, dict):
+            return False
+        lines = payload.get("Lines", {})
         if not isinstance(lines, dict):
             return False
+        part = payload.get("SessionPart")
+        if not lines and part is None:
+            return False
         drivers = self._state["drivers"]
         changed = False
         position_changed = False
@@ -4615,23 +4918,8 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         for rn, td in lines.items():
             if not isinstance(td, dict):
                 continue
-            entry = drivers.setdefault(rn, {})
-            entry.setdefault("identity", {})
-            entry.setdefault("timing", {})
-            entry.setdefault("tyres", {})
-            entry.setdefault("laps", {})
-            entry.setdefault(
-                "tyre_history", {"stints": [], "current_stint_index": None}
-            )
-            entry.setdefault(
-                "lap_history",
-                {
-                    "laps": {},
-                    "last_recorded_lap": 0,
-                    "grid_position": None,
-                    "completed_laps": 0,
-                },
-            )
+            rn = rn if type(rn) is str else str(rn)
+            entry = self._driver_entry(drivers, rn)
             self._ensure_sector_state(entry)
             timing = entry["timing"]
             lap_history = entry["lap_history"]
@@ -4654,6 +4942,10 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
                 pos_value = pos_str or None
                 if timing.get("position") != pos_value:
                     timing["position"] = pos_value
+                    if pos_value is not None and pos_value.isdigit():
+                        self._position_index[rn] = int(pos_value)
+                    else:
+                        self._position_index.pop(rn, None)
                     changed = True
                     position_changed = True
                 if (
@@ -4663,10 +4955,18 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
                 ):
                     lap_history["grid_position"] = pos_value
                     changed = True
-            if "GapToLeader" in td:
-                gap_val = td.get("GapToLeader")
-                if timing.get("gap_to_leader") != gap_val:
-                    timing["gap_to_leader"] = gap_val
+            # Plain scalar fields: dispatch only the keys present in this delta
+            for key, raw in td.items():
+                field = _TIMING_SCALAR_FIELDS.get(key)
+                if field is None:
+                    continue
+                name, coerce = field
+                if coerce is not None:
+                    raw = coerce(raw)
+                    if raw is None:
+                        continue
+                if timing.get(name) != raw:
+                    timing[name] = raw
                     changed = True
             ival = self._get_value(td, "IntervalToPositionAhead", "Value")
             if ival is not None:
@@ -4697,36 +4997,6 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
                     rn, best_lap_num, best_lap
                 ):
                     changed = True
-            if "InPit" in td:
-                in_pit = bool(td.get("InPit"))
-                if timing.get("in_pit") != in_pit:
-                    timing["in_pit"] = in_pit
-                    changed = True
-            if "PitOut" in td:
-                pit_out = bool(td.get("PitOut"))
-                if timing.get("pit_out") != pit_out:
-                    timing["pit_out"] = pit_out
-                    changed = True
-            if "NumberOfPitStops" in td:
-                pit_stops = self._parse_stream_int(td.get("NumberOfPitStops"))
-                if pit_stops is not None and timing.get("pit_stops") != pit_stops:
-                    timing["pit_stops"] = pit_stops
-                    changed = True
-            if "Retired" in td:
-                retired = bool(td.get("Retired"))
-                if timing.get("retired") != retired:
-                    timing["retired"] = retired
-                    changed = True
-            if "Stopped" in td:
-                stopped = bool(td.get("Stopped"))
-                if timing.get("stopped") != stopped:
-                    timing["stopped"] = stopped
-                    changed = True
-            if "Status" in td:
-                status = td.get("Status")
-                if timing.get("status_code") != status:
-                    timing["status_code"] = status
-                    changed = True
             sectors_raw = td.get("Sectors")
             if sectors_raw is not None:
                 if self._merge_sectors(rn, entry, sectors_raw):
@@ -4763,17 +5033,16 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
                     seg["best_time"] = value
                     changed = True
         # SessionPart (for Q1/Q2/Q3 detection)
-        with suppress(Exception):
-            part = payload.get("SessionPart")
-            if part is not None:
-                self._state.setdefault("session", {})
-                old_part = self._state["session"].get("part")
-                if old_part != part:
-                    self._state["session"]["part"] = part
-                    changed = True
-                    # New qualifying segment: reset all sector bests for all drivers
-                    if old_part is not None:
-                        for drv_entry in self._state["drivers"].values():
+        if part is not None:
+            session = self._state.setdefault("session", {})
+            old_part = session.get("part")
+            if old_part != part:
+                session["part"] = part
+                changed = True
+                # New qualifying segment: reset all sector bests for all drivers
+                if old_part is not None:
+                    with suppress(Exception):
+                        for drv_entry in drivers.values():
                             s = drv_entry.get("sectors")
                             if s:
                                 self._reset_sector_state(s, reset_best=True)
@@ -5010,7 +5279,7 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
             status = sd.get("Status")
             if not value_str or sd.get("Stopped") or status == 2048:
                 continue
-            time_secs = self._parse_laptime_secs(value_str)
+            time_secs = _parse_laptime_secs(value_str)
             if time_secs is None:
                 continue
             sector_lap = self._current_sector_lap(entry, sectors, idx)
@@ -5097,6 +5366,24 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
                     self._reset_sector_state(s, reset_best=False)
             self._schedule_deliver()
 
+    def reset_for_replay(self) -> None:
+        """Drop accumulated driver state before a replay rebuild or rewind."""
+        _clear_delayed_ingest_state(self)
+        self._deliver_handle = _cancel_handle(self._deliver_handle)
+        self._position_index.clear()
+        self._state = {
+            "drivers": {},
+            "leader_rn": None,
+            "lap_current": None,
+            "lap_total": None,
+            "session_status": None,
+            "track_status": None,
+            "frozen": False,
+            "tyre_statistics": {},
+            "fastest_lap": self._empty_fastest_lap(),
+        }
+        self.async_set_updated_data(self._state)
+
     def set_delay(self, seconds: int) -> None:
         _apply_delay_with_queue(self, seconds)
 
@@ -5118,18 +5405,29 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
             # show stale driver/timing information before the first live frames.
             _clear_delayed_ingest_state(self)
             with suppress(Exception):
-                self._state = {
-                    "drivers": {},
-                    "leader_rn": None,
-                    "lap_current": None,
-                    "lap_total": None,
-                    "session_status": None,
-                    "track_status": None,
-                    "frozen": False,
-                    "tyre_statistics": {},
-                    "fastest_lap": self._empty_fastest_lap(),
-                }
-                self.async_set_updated_data(self._state)
+                # The reset is published right away; drop any pending batch
+                self._deliver_handle = _cancel_handle(self._deliver_handle)
+                self._position_index.clear()
+                # Reset in place so holders of the published dict see the
+                # cleared view; keys added during the session are dropped too.
+                state = self._state
+                drivers = state["drivers"]
+                drivers.clear()
+                state.clear()
+                state.update(
+                    {
+                        "drivers": drivers,
+                        "leader_rn": None,
+                        "lap_current": None,
+                        "lap_total": None,
+                        "session_status": None,
+                        "track_status": None,
+                        "frozen": False,
+                        "tyre_statistics": {},
+                        "fastest_lap": self._empty_fastest_lap(),
+                    }
+                )
+                self.async_set_updated_data(state)
             return
         # 2) Recompute leader from full stored state (not just current delta)
         self._recompute_leader_from_state()
@@ -5146,18 +5444,19 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
                     items.append((idx, stint))
         elif isinstance(stints, dict):
             for key, stint in stints.items():
-                key_text = str(key).strip()
+                if not isinstance(stint, dict):
+                    continue
+                key_text = key.strip() if isinstance(key, str) else str(key).strip()
+                if not key_text.isdecimal():
+                    continue
+                # Bound the digit count before int() so oversized keys are cheap
+                # to reject; decimal text always parses, so no try is needed.
                 key_digits = key_text.lstrip("0") or "0"
-                if (
-                    not isinstance(stint, dict)
-                    or not key_text.isdecimal()
-                    or len(key_digits) > len(str(MAX_TYRE_STINT_INDEX))
-                ):
+                if len(key_digits) > _MAX_TYRE_STINT_INDEX_DIGITS:
                     continue
-                with suppress(ValueError):
-                    idx = int(key_text)
-                    if 0 <= idx <= MAX_TYRE_STINT_INDEX:
-                        items.append((idx, stint))
+                idx = int(key_digits)
+                if idx <= MAX_TYRE_STINT_INDEX:
+                    items.append((idx, stint))
         items.sort(key=lambda item: item[0])
         return items
 
@@ -5218,31 +5517,10 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         self._tyre_missing_warning_logged = True
 
     def _recompute_leader_from_state(self) -> None:
-        drivers = self._state.get("drivers", {}) or {}
         prev = self._state.get("leader_rn")
-        # Prefer explicit position == "1"
-        leader_rn = None
-        for rn, info in drivers.items():
-            pos = (info.get("timing", {}) or {}).get("position")
-            if str(pos or "").strip() == "1":
-                leader_rn = rn
-                break
-        if leader_rn is None:
-            # Fallback: minimal numeric position across all stored drivers
-            best: tuple[int, str] | None = None
-            for rn, info in drivers.items():
-                pos_str = str(
-                    (info.get("timing", {}) or {}).get("position") or ""
-                ).strip()
-                try:
-                    pos_int = int(pos_str) if pos_str.isdigit() else None
-                except Exception:
-                    pos_int = None
-                if isinstance(pos_int, int):
-                    if best is None or pos_int < best[0]:
-                        best = (pos_int, rn)
-            if best is not None:
-                leader_rn = best[1]
+        # Minimal numeric position across all stored drivers (P1 when present)
+        index = self._position_index
+        leader_rn = min(index, key=index.__getitem__) if index else None
         if leader_rn is None and prev:
             # If we cannot determine a leader from current positions, keep previous to avoid flapping
             leader_rn = prev
@@ -5272,23 +5550,8 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
             if not stint_items:
                 continue
 
-            entry = drivers.setdefault(rn, {})
-            entry.setdefault("identity", {})
-            entry.setdefault("timing", {})
-            entry.setdefault("tyres", {})
-            entry.setdefault("laps", {})
-            entry.setdefault(
-                "tyre_history", {"stints": [], "current_stint_index": None}
-            )
-            entry.setdefault(
-                "lap_history",
-                {
-                    "laps": {},
-                    "last_recorded_lap": 0,
-                    "grid_position": None,
-                    "completed_laps": 0,
-                },
-            )
+            rn = rn if type(rn) is str else str(rn)
+            entry = self._driver_entry(drivers, rn)
             latest: dict[str, Any] | None = None
 
             tyres = entry["tyres"]
@@ -5314,21 +5577,14 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
                     stints_changed = True
             if "TotalLaps" in latest:
                 stint_laps = latest.get("TotalLaps")
-                stint_laps_val = (
-                    int(stint_laps) if str(stint_laps or "").isdigit() else stint_laps
-                )
+                stint_laps_val = _stint_lap_count(stint_laps)
+                if stint_laps_val is None:
+                    stint_laps_val = stint_laps
                 if tyres.get("stint_laps") != stint_laps_val:
                     tyres["stint_laps"] = stint_laps_val
                     stints_changed = True
             if "New" in latest:
-                is_new = latest.get("New")
-                s = str(is_new).lower()
-                if s == "true":
-                    new_val: Any = True
-                elif s == "false":
-                    new_val = False
-                else:
-                    new_val = is_new
+                new_val = _stint_new_flag(latest["New"])
                 if tyres.get("new") != new_val:
                     tyres["new"] = new_val
                     stints_changed = True
@@ -5382,37 +5638,12 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         stint = stints_list[stint_idx]
 
         # Only update fields that are present in the delta
-        if "Compound" in stint_data:
-            compound = self._normalize_compound(stint_data.get("Compound"))
-            if stint.get("compound") != compound:
-                stint["compound"] = compound
-                changed = True
-        if "TotalLaps" in stint_data:
-            total_laps = stint_data.get("TotalLaps")
-            total_laps_val = int(total_laps) if str(total_laps or "").isdigit() else 0
-            if stint.get("total_laps") != total_laps_val:
-                stint["total_laps"] = total_laps_val
-                changed = True
-        if "StartLaps" in stint_data:
-            start_laps = stint_data.get("StartLaps")
-            start_laps_val = (
-                int(start_laps) if str(start_laps or "").isdigit() else None
-            )
-            if stint.get("start_laps") != start_laps_val:
-                stint["start_laps"] = start_laps_val
-                changed = True
-        if "New" in stint_data:
-            is_new = stint_data.get("New")
-            s = str(is_new).lower()
-            if s == "true":
-                new_val: Any = True
-            elif s == "false":
-                new_val = False
-            else:
-                new_val = is_new
-            if stint.get("new") != new_val:
-                stint["new"] = new_val
-                changed = True
+        for src, dst, coerce in _STINT_FIELDS:
+            if src in stint_data:
+                value = coerce(stint_data[src])
+                if stint.get(dst) != value:
+                    stint[dst] = value
+                    changed = True
         return changed
 
     def _record_lap_time_for_stint(self, rn: str, lap_time: str) -> bool:
@@ -5432,7 +5663,7 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
             return False
 
         stint = stints_list[current_idx]
-        lap_secs = self._parse_laptime_secs(lap_time)
+        lap_secs = _parse_laptime_secs(lap_time)
         if lap_secs is None:
             return False
 
@@ -5441,8 +5672,7 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         if current_best is None or lap_secs < current_best:
             stint["best_lap_time"] = lap_time
             stint["best_lap_time_secs"] = lap_secs
-            # Recompute statistics when a new best lap is set
-            self._recompute_tyre_statistics()
+            self._update_tyre_best_time(rn, entry, stint)
             return True
         return False
 
@@ -5541,7 +5771,7 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
 
     def _update_fastest_lap(self, rn: str, lap_num: int | None, lap_time: str) -> bool:
         """Update overall fastest lap if the provided lap is quicker."""
-        lap_secs = self._parse_laptime_secs(lap_time)
+        lap_secs = _parse_laptime_secs(lap_time)
         if lap_secs is None:
             return False
 
@@ -5553,7 +5783,7 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         if prev_secs is not None and lap_secs >= prev_secs:
             return False
 
-        rn_key = str(rn)
+        rn_key = rn if type(rn) is str else str(rn)
         entry = self._state.get("drivers", {}).get(rn_key, {}) or {}
         identity = entry.get("identity", {}) if isinstance(entry, dict) else {}
         team_color = self._normalize_team_color(identity.get("team_color"))
@@ -5570,117 +5800,67 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         }
         return True
 
-    def _recompute_fastest_lap_from_history(self) -> bool:
-        """Recompute fastest lap by scanning lap history (replay init)."""
-        drivers = self._state.get("drivers", {}) or {}
-        best_secs: float | None = None
-        best_rn: str | None = None
-        best_lap: int | None = None
-        best_time: str | None = None
-
-        for rn in sorted(drivers.keys(), key=str):
-            entry = drivers.get(rn, {}) or {}
-            lap_history = entry.get("lap_history", {}) or {}
-            laps = lap_history.get("laps", {})
-            if not isinstance(laps, dict):
-                continue
-            for lap_key, lap_time in laps.items():
-                if not isinstance(lap_time, str) or not lap_time:
-                    continue
-                lap_secs = self._parse_laptime_secs(lap_time)
-                if lap_secs is None:
-                    continue
-                if best_secs is not None and lap_secs >= best_secs:
-                    continue
-                try:
-                    lap_num = int(lap_key)
-                except (TypeError, ValueError):
-                    lap_num = None
-                best_secs = lap_secs
-                best_rn = str(rn)
-                best_lap = lap_num
-                best_time = lap_time
-
-        if best_secs is None or best_rn is None or best_time is None:
-            empty = self._empty_fastest_lap()
-            if self._state.get("fastest_lap") != empty:
-                self._state["fastest_lap"] = empty
-                return True
-            return False
-
-        entry = drivers.get(best_rn, {}) or {}
-        identity = entry.get("identity", {}) if isinstance(entry, dict) else {}
-        team_color = self._normalize_team_color(identity.get("team_color"))
-
-        fastest = {
-            "racing_number": best_rn,
-            "lap": best_lap,
-            "time": best_time,
-            "time_secs": best_secs,
-            "tla": identity.get("tla"),
-            "name": identity.get("name"),
-            "team": identity.get("team"),
-            "team_color": team_color,
-        }
-        if self._state.get("fastest_lap") != fastest:
-            self._state["fastest_lap"] = fastest
-            return True
-        return False
-
     def _recompute_tyre_statistics(self) -> None:
         """Recompute aggregated tyre statistics from all driver stint history."""
         compounds_data: dict[str, dict] = {}
         start_compounds: set[str] = set()
         drivers = self._state.get("drivers", {})
+        normalize = _normalize_compound_value
 
         for rn, info in drivers.items():
-            tyre_history = info.get("tyre_history", {})
+            stints = info.get("tyre_history", {}).get("stints")
+            if not stints:
+                continue
             identity = info.get("identity", {})
             driver_name = identity.get("last_name") or identity.get("name")
+            driver_tla = identity.get("tla")
             team_color = identity.get("team_color")
 
-            for stint in tyre_history.get("stints", []):
-                compound = self._normalize_compound(stint.get("compound"))
+            for stint in stints:
+                compound = normalize(stint.get("compound"))
                 if not compound or compound == "UNKNOWN":
                     continue
-                if stint.get("stint_index") == 0:
+                stint_index = stint.get("stint_index")
+                is_new = stint.get("new")
+                if stint_index == 0:
                     start_compounds.add(compound)
 
-                comp = compounds_data.setdefault(
-                    compound,
-                    {
+                comp = compounds_data.get(compound)
+                if comp is None:
+                    comp = compounds_data[compound] = {
                         "best_times": [],
                         "total_laps": 0,
                         "sets_used": 0,
                         "sets_used_total": 0,
-                    },
-                )
+                    }
 
                 # Accumulate laps
                 comp["total_laps"] += stint.get("total_laps", 0) or 0
                 comp["sets_used_total"] += 1
-                if stint.get("new") is True:
+                if is_new is True:
                     comp["sets_used"] += 1
 
                 # Track best times (only if we have a recorded time)
-                if stint.get("best_lap_time_secs") is not None:
+                best_secs = stint.get("best_lap_time_secs")
+                if best_secs is not None:
                     comp["best_times"].append(
                         {
                             "time": stint["best_lap_time"],
-                            "time_secs": stint["best_lap_time_secs"],
+                            "time_secs": best_secs,
                             "racing_number": rn,
                             "driver_name": driver_name,
-                            "driver_tla": identity.get("tla"),
+                            "driver_tla": driver_tla,
                             "team_color": team_color,
-                            "stint_index": stint.get("stint_index"),
-                            "new_tyre": stint.get("new"),
+                            "stint_index": stint_index,
+                            "new_tyre": is_new,
                         }
                     )
 
-        # Sort and trim to top 3 per compound
+        # Keep the top 3 per compound; nsmallest avoids sorting every stint
         for comp in compounds_data.values():
-            comp["best_times"].sort(key=lambda x: x["time_secs"])
-            comp["best_times"] = comp["best_times"][:3]
+            comp["best_times"] = heapq.nsmallest(
+                3, comp["best_times"], key=itemgetter("time_secs")
+            )
 
         # Calculate fastest compound and deltas
         fastest_time: float | None = None
@@ -5710,6 +5890,99 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
             "start_compounds": self._sort_compounds(start_compounds),
         }
 
+    def _update_tyre_best_time(
+        self, rn: str, entry: dict[str, Any], stint: dict[str, Any]
+    ) -> None:
+        """Fold one improved stint best into the tyre statistics.
+
+        Stint bests only ever get faster, so the compound's top 3 can be kept
+        exact by replacing this stint's row and re-trimming; lap counts and
+        set usage are untouched. Falls back to a full rebuild when the
+        compound has no aggregate yet.
+        """
+        stats = self._state.get("tyre_statistics") or {}
+        compound = self._normalize_compound(stint.get("compound"))
+        compounds = stats.get("compounds")
+        if (
+            not compound
+            or compound == "UNKNOWN"
+            or not isinstance(compounds, dict)
+            or compound not in compounds
+        ):
+            self._recompute_tyre_statistics()
+            return
+
+        identity = entry.get("identity", {})
+        stint_index = stint.get("stint_index")
+        best_times = [
+            row
+            for row in compounds[compound]["best_times"]
+            if row["racing_number"] != rn or row["stint_index"] != stint_index
+        ]
+        best_times.append(
+            {
+                "time": stint["best_lap_time"],
+                "time_secs": stint["best_lap_time_secs"],
+                "racing_number": rn,
+                "driver_name": identity.get("last_name") or identity.get("name"),
+                "driver_tla": identity.get("tla"),
+                "team_color": identity.get("team_color"),
+                "stint_index": stint_index,
+                "new_tyre": stint.get("new"),
+            }
+        )
+        best_times.sort(key=itemgetter("time_secs"))
+
+        # Copy the touched levels so previously published dicts stay intact
+        compounds = dict(compounds)
+        compounds[compound] = {**compounds[compound], "best_times": best_times[:3]}
+        leaders = {
+            name: data["best_times"][0]["time_secs"]
+            for name, data in compounds.items()
+            if data["best_times"]
+        }
+        fastest_compound = min(leaders, key=leaders.__getitem__)
+        fastest_time = leaders[fastest_compound]
+        self._state["tyre_statistics"] = {
+            **stats,
+            "compounds": compounds,
+            "fastest_compound": fastest_compound,
+            "fastest_time": (
+                self._format_laptime(fastest_time) if fastest_time else None
+            ),
+            "fastest_time_secs": fastest_time,
+            "deltas": {
+                name: round(secs - fastest_time, 3) for name, secs in leaders.items()
+            },
+        }
+
+    def _refresh_tyre_stats_identity(self) -> None:
+        """Re-stamp driver identity on tyre best-time rows without re-aggregating."""
+        stats = self._state.get("tyre_statistics") or {}
+        compounds = stats.get("compounds")
+        if not compounds:
+            return
+        drivers = self._state.get("drivers", {})
+        refreshed: dict[str, dict] = {}
+        changed = False
+        for name, data in compounds.items():
+            rows = []
+            for row in data["best_times"]:
+                identity = drivers.get(row["racing_number"], {}).get("identity", {})
+                fields = {
+                    "driver_name": identity.get("last_name") or identity.get("name"),
+                    "driver_tla": identity.get("tla"),
+                    "team_color": identity.get("team_color"),
+                }
+                if fields.items() <= row.items():
+                    rows.append(row)
+                else:
+                    rows.append({**row, **fields})
+                    changed = True
+            refreshed[name] = {**data, "best_times": rows}
+        if changed:
+            self._state["tyre_statistics"] = {**stats, "compounds": refreshed}
+
     @staticmethod
     def _format_laptime(secs: float | None) -> str | None:
         """Format seconds as M:SS.mmm lap time string."""
@@ -5736,9 +6009,7 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
     def _normalize_team_color(value: Any) -> Any:
         if not isinstance(value, str) or not value:
             return value
-        if value.startswith("#"):
-            return value
-        return f"#{value}"
+        return _normalize_team_color_text(value)
 
     def _merge_lapcount(self, payload: dict) -> None:
         # payload may be either {CurrentLap, TotalLaps} or wrapped
@@ -5761,42 +6032,16 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         # Recompute leader as lap and position updates can interact
         self._recompute_leader_from_state()
 
-    @staticmethod
-    def _parse_laptime_secs(value: str | None) -> float | None:
-        """Parse a lap time formatted like 'M:SS.mmm' or 'SS.mmm' to seconds."""
-        if not value:
-            return None
-        try:
-            s = value.strip()
-            if ":" in s:
-                minutes_str, sec_str = s.split(":", 1)
-                minutes = int(minutes_str)
-                seconds = float(sec_str)
-                return minutes * 60.0 + seconds
-            return float(s)
-        except Exception:
-            return None
-
     @staticmethod
     def _normalize_compound(value: Any) -> str | None:
-        if not isinstance(value, str):
-            return value if value is None else str(value)
-        comp = value.strip().upper()
-        if not comp:
-            return None
-        if comp in {"INTER", "INTERS", "INTERMEDIATES"}:
-            return "INTERMEDIATE"
-        if comp in {"WETS", "FULLWET", "FULL WET", "FULL_WET"}:
-            return "WET"
-        return comp
+        return _normalize_compound_value(value)
 
     @staticmethod
     def _sort_compounds(compounds: set[str]) -> list[str]:
-        order = ["SOFT", "MEDIUM", "HARD", "INTERMEDIATE", "WET"]
-        order_index = {name: idx for idx, name in enumerate(order)}
+        fallback = len(_COMPOUND_SORT_ORDER)
         return sorted(
             compounds,
-            key=lambda name: (order_index.get(name, len(order_index)), name),
+            key=lambda name: (_COMPOUND_SORT_ORDER.get(name, fallback), name),
         )
 
     def _capture_grid_positions_if_needed(self) -> None:
@@ -5870,34 +6115,26 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
 
     @staticmethod
     def _extract(data: dict, key: str) -> dict | None:
-        if not isinstance(data, dict):
-            return None
-        messages = data.get("M")
-        if isinstance(messages, list):
-            for update in messages:
-                args = update.get("A", [])
-                if len(args) >= 2 and args[0] == key:
-                    return args[1]
-        result = data.get("R")
-        if isinstance(result, dict) and key in result:
-            return result.get(key)
-        return None
+        return _parse_signalr_message(data, key)
 
     def _deliver(self) -> None:
         if _is_no_spoiler_blocked(self):
             return
-        # Push deep-copied shallow dict to avoid accidental external mutation
+        # Publish the live store itself; consumers treat coordinator data as
+        # read-only, so no copy is made per delivery.
         self.async_set_updated_data(self._state)
 
     def _schedule_deliver(self) -> None:
-        self._deliver()
+        # Merges landing in the same loop turn (DriverList, TimingData,
+        # TimingAppData, ...) share one listener fan-out on the next pass.
+        _schedule_coalesced_deliver(self, always=True)
 
     def _on_driverlist(self, dl: dict) -> None:
         # Allow DriverList merges even when frozen so identity mapping remains available
         changed = self._merge_driverlist(dl)
         if changed:
-            # Recompute tyre statistics to update driver names/TLAs
-            self._recompute_tyre_statistics()
+            # DriverList never touches stints; only re-stamp names/TLAs/colours
+            self._refresh_tyre_stats_identity()
             self._schedule_deliver()
 
     def _on_timingdata(self, td: dict) -> None:
@@ -5932,24 +6169,9 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         for rn, info in payload.items():
             if not isinstance(info, dict):
                 continue
+            rn = rn if type(rn) is str else str(rn)
 
-            entry = drivers.setdefault(rn, {})
-            entry.setdefault("identity", {})
-            entry.setdefault("timing", {})
-            entry.setdefault("tyres", {})
-            entry.setdefault("laps", {})
-            entry.setdefault(
-                "tyre_history", {"stints": [], "current_stint_index": None}
-            )
-            entry.setdefault(
-                "lap_history",
-                {
-                    "laps": {},
-                    "last_recorded_lap": 0,
-                    "grid_position": None,
-                    "completed_laps": 0,
-                },
-            )
+            entry = self._driver_entry(drivers, rn)
 
             timing = entry["timing"]
             if "PitStops" in info:
@@ -5990,24 +6212,10 @@ class LiveDriversCoordinator(DataUpdateCoordinator):
         for rn, history_data in lh.items():
             if not isinstance(history_data, dict):
                 continue
+            rn = rn if type(rn) is str else str(rn)
             # Create driver entry if it doesn't exist (LapHistory may arrive before DriverList/TimingData)
-            entry = drivers.setdefault(rn, {})
-            entry.setdefault("identity", {})
-            entry.setdefault("timing", {})
-            entry.setdefault("tyres", {})
-            entry.setdefault("laps", {})
-            entry.setdefault(
-                "tyre_history", {"stints": [], "current_stint_index": None}
-            )
-            lap_history = entry.setdefault(
-                "lap_history",
-                {
-                    "laps": {},
-                    "last_recorded_lap": 0,
-                    "grid_position": None,
-                    "completed_laps": 0,
-                },
-            )
+            entry = self._driver_entry(drivers, rn)
+            lap_history = entry["lap_history"]
             # Only apply if our lap_history is empty (initial load)
             if lap_history.get("last_recorded_lap", 0) == 0:
                 laps = history_data.get("laps", {})
@@ -6167,11 +6375,6 @@ def _reset_replay_sensitive_coordinator_state(coordinator: Any) -> None:
     if coordinator is None:
         return
 
-    reset_for_replay = getattr(coordinator, "reset_for_replay", None)
-    if callable(reset_for_replay):
-        reset_for_replay()
-        return
-
     if isinstance(coordinator, WeatherDataCoordinator):
         _clear_delayed_ingest_state(coordinator)
         coordinator._last_message = None
@@ -6180,14 +6383,10 @@ def _reset_replay_sensitive_coordinator_state(coordinator: Any) -> None:
         return
 
     if isinstance(coordinator, RaceControlCoordinator):
-        for handle in list(coordinator._deliver_handles):
-            with suppress(Exception):
-                handle.cancel()
-        coordinator._deliver_handles.clear()
+        _cancel_handles(coordinator._deliver_handles)
         coordinator._last_message = None
         coordinator.data_list = []
-        coordinator._seen_ids_set.clear()
-        coordinator._seen_ids_order.clear()
+        coordinator._seen_ids.clear()
         coordinator._startup_cutoff = None
         coordinator.async_set_updated_data(None)
         return
@@ -6196,6 +6395,10 @@ def _reset_replay_sensitive_coordinator_state(coordinator: Any) -> None:
         coordinator.reset_for_replay()
         return
 
+    if isinstance(coordinator, LiveDriversCoordinator):
+        coordinator.reset_for_replay()
+        return
+
     if isinstance(coordinator, LiveModeCoordinator):
         coordinator._clear_mode_state()
         coordinator.async_set_updated_data(None)
@@ -6218,31 +6421,12 @@ def _reset_replay_sensitive_coordinator_state(coordinator: Any) -> None:
         coordinator._reset_store()
         return
 
-    if isinstance(coordinator, LiveDriversCoordinator):
-        _clear_delayed_ingest_state(coordinator)
-        coordinator._state = {
-            "drivers": {},
-            "leader_rn": None,
-            "lap_current": None,
-            "lap_total": None,
-            "session_status": None,
-            "track_status": None,
-            "frozen": False,
-            "tyre_statistics": {},
-            "fastest_lap": coordinator._empty_fastest_lap(),
-        }
-        coordinator.async_set_updated_data(coordinator._state)
-        return
-
     if isinstance(coordinator, TrackStatusCoordinator):
         if coordinator._deliver_handle is not None:
             with suppress(Exception):
                 coordinator._deliver_handle.cancel()
             coordinator._deliver_handle = None
-        for handle in list(coordinator._deliver_handles):
-            with suppress(Exception):
-                handle.cancel()
-        coordinator._deliver_handles.clear()
+        _cancel_handles(coordinator._deliver_handles)
         coordinator._last_message = None
         coordinator.data_list = []
         coordinator._startup_cutoff = None
@@ -7545,18 +7729,6 @@ class F1LapPositionProgressionCoordinator(DataUpdateCoordinator):
         except (TypeError, ValueError):
             return None
 
-    @staticmethod
-    def _to_int(value: Any) -> int | None:
-        try:
-            if value is None:
-                return None
-            text = str(value).strip()
-            if not text:
-                return None
-            return int(float(text))
-        except (TypeError, ValueError):
-            return None
-
     @staticmethod
     def _driver_name(driver: dict) -> str | None:
         given = str(driver.get("givenName") or "").strip()
@@ -7591,7 +7763,7 @@ class F1LapPositionProgressionCoordinator(DataUpdateCoordinator):
 
     @staticmethod
     def _sort_timing_key(timing: dict) -> tuple[int, str]:
-        position = F1LapPositionProgressionCoordinator._to_int(timing.get("position"))
+        position = _coerce_int(timing.get("position"))
         return (
             position if position is not None else 999,
             str(timing.get("driverId") or ""),
@@ -7680,7 +7852,7 @@ class F1LapPositionProgressionCoordinator(DataUpdateCoordinator):
                         )
                     }
                 for lap in page_race.get("Laps", []) or []:
-                    lap_number = self._to_int(lap.get("number"))
+                    lap_number = _coerce_int(lap.get("number"))
                     if lap_number is None:
                         continue
                     timings_by_driver = lap_timings.setdefault(lap_number, {})
@@ -7736,14 +7908,14 @@ class F1LapPositionProgressionCoordinator(DataUpdateCoordinator):
         first_seen: dict[str, int] = {}
 
         for lap_index, lap in enumerate(laps):
-            lap_number = self._to_int(lap.get("number"))
+            lap_number = _coerce_int(lap.get("number"))
             if lap_number is None:
                 continue
             for timing in lap.get("Timings", []) or []:
                 if not isinstance(timing, dict):
                     continue
                 driver_id = str(timing.get("driverId") or "").strip()
-                position = self._to_int(timing.get("position"))
+                position = _coerce_int(timing.get("position"))
                 if not driver_id or position is None:
                     continue
                 positions_by_driver.setdefault(driver_id, {})[lap_number] = position
@@ -7752,7 +7924,7 @@ class F1LapPositionProgressionCoordinator(DataUpdateCoordinator):
         ordered_driver_ids = sorted(
             set(result_metadata) | set(positions_by_driver),
             key=lambda driver_id: (
-                self._to_int(
+                _coerce_int(
                     result_metadata.get(driver_id, {}).get("result", {}).get("position")
                 )
                 or 999,
@@ -7761,7 +7933,7 @@ class F1LapPositionProgressionCoordinator(DataUpdateCoordinator):
             ),
         )
 
-        lap_numbers = [self._to_int(lap.get("number")) for lap in laps]
+        lap_numbers = [_coerce_int(lap.get("number")) for lap in laps]
         lap_numbers = [
             lap_number for lap_number in lap_numbers if lap_number is not None
         ]
@@ -7780,10 +7952,10 @@ class F1LapPositionProgressionCoordinator(DataUpdateCoordinator):
                 for lap_number in lap_numbers
             ]
             known_positions = [pos for pos in positions if pos is not None]
-            finish_position = self._to_int(result.get("position"))
+            finish_position = _coerce_int(result.get("position"))
             if finish_position is None and known_positions:
                 finish_position = known_positions[-1]
-            grid = self._to_int(result.get("grid"))
+            grid = _coerce_int(result.get("grid"))
             net_change = (
                 grid - finish_position
                 if grid is not None and grid > 0 and finish_position is not None
@@ -8476,12 +8648,7 @@ class TrackStatusCoordinator(DataUpdateCoordinator):
         if not isinstance(msg, dict):
             return
         # Drop old messages near startup
-        utc_str = (
-            msg.get("Utc")
-            or msg.get("utc")
-            or msg.get("processedAt")
-            or msg.get("timestamp")
-        )
+        utc_str = _first_value(msg, _TS_KEYS)
         with suppress(Exception):
             if utc_str:
                 ts = datetime.fromisoformat(str(utc_str).replace("Z", "+00:00"))
@@ -8491,7 +8658,7 @@ class TrackStatusCoordinator(DataUpdateCoordinator):
                     return
         # Dedupe untimestamped exact repeats to avoid flooding when delayed
         try:
-            has_ts = any(k in msg for k in ("Utc", "utc", "processedAt", "timestamp"))
+            has_ts = any(k in msg for k in _TS_KEYS)
         except Exception:
             has_ts = False
         if not has_ts:
@@ -8530,20 +8697,7 @@ class TrackStatusCoordinator(DataUpdateCoordinator):
 
     @staticmethod
     def _parse_message(data):
-        if not isinstance(data, dict):
-            return None
-        # Handle live feed entries
-        messages = data.get("M")
-        if isinstance(messages, list):
-            for update in messages:
-                args = update.get("A", [])
-                if len(args) >= 2 and args[0] == "TrackStatus":
-                    return args[1]
-        # Handle RPC responses
-        result = data.get("R")
-        if isinstance(result, dict) and "TrackStatus" in result:
-            return result.get("TrackStatus")
-        return None
+        return _parse_signalr_message(data, "TrackStatus")
 
     def _deliver(self, msg: dict) -> None:
         if _is_no_spoiler_blocked(self):
@@ -8557,8 +8711,7 @@ class TrackStatusCoordinator(DataUpdateCoordinator):
         if _LOGGER.isEnabledFor(logging.DEBUG):
             with suppress(Exception):
                 _LOGGER.debug(
-                    "TrackStatus delivered at %s status=%s message=%s",
-                    dt_util.utcnow().isoformat(timespec="seconds"),
+                    "TrackStatus delivered status=%s message=%s",
                     (msg or {}).get("Status"),
                     (msg or {}).get("Message"),
                 )
@@ -8732,18 +8885,7 @@ class SessionStatusCoordinator(DataUpdateCoordinator):
 
     @staticmethod
     def _parse_message(data):
-        if not isinstance(data, dict):
-            return None
-        messages = data.get("M")
-        if isinstance(messages, list):
-            for update in messages:
-                args = update.get("A", [])
-                if len(args) >= 2 and args[0] == "SessionStatus":
-                    return args[1]
-        result = data.get("R")
-        if isinstance(result, dict) and "SessionStatus" in result:
-            return result.get("SessionStatus")
-        return None
+        return _parse_signalr_message(data, "SessionStatus")
 
     def _deliver(self, msg: dict) -> None:
         if _is_no_spoiler_blocked(self):
@@ -8755,8 +8897,7 @@ class SessionStatusCoordinator(DataUpdateCoordinator):
         if _LOGGER.isEnabledFor(logging.DEBUG):
             with suppress(Exception):
                 _LOGGER.debug(
-                    "SessionStatus delivered at %s status=%s started=%s",
-                    dt_util.utcnow().isoformat(timespec="seconds"),
+                    "SessionStatus delivered status=%s started=%s",
                     (msg or {}).get("Status"),
                     (msg or {}).get("Started"),
                 )
@@ -8891,7 +9032,7 @@ class TopThreeCoordinator(DataUpdateCoordinator):
         _apply_delay_with_queue(self, seconds)
 
     def _schedule_deliver(self) -> None:
-        self._deliver()
+        _schedule_coalesced_deliver(self)
 
     def _merge_topthree(self, payload: dict) -> None:
         """Merge a TopThree payload (full snapshot or partial delta) into state."""
@@ -9051,18 +9192,7 @@ class SessionInfoCoordinator(DataUpdateCoordinator):
 
     @staticmethod
     def _parse_message(data):
-        if not isinstance(data, dict):
-            return None
-        messages = data.get("M")
-        if isinstance(messages, list):
-            for update in messages:
-                args = update.get("A", [])
-                if len(args) >= 2 and args[0] == "SessionInfo":
-                    return args[1]
-        result = data.get("R")
-        if isinstance(result, dict) and "SessionInfo" in result:
-            return result.get("SessionInfo")
-        return None
+        return _parse_signalr_message(data, "SessionInfo")
 
     def _deliver(self, msg: dict) -> None:
         if _is_no_spoiler_blocked(self):
@@ -9076,8 +9206,7 @@ class SessionInfoCoordinator(DataUpdateCoordinator):
                 name = (msg or {}).get("Name")
                 t = (msg or {}).get("Type")
                 _LOGGER.debug(
-                    "SessionInfo delivered at %s type=%s name=%s",
-                    dt_util.utcnow().isoformat(timespec="seconds"),
+                    "SessionInfo delivered type=%s name=%s",
                     t,
                     name,
                 )
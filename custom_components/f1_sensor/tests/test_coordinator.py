@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -13,6 +14,9 @@ from custom_components.f1_sensor.__init__ import (
     F1SeasonResultsCoordinator,
     FiaDocumentsCoordinator,
     LiveSessionCoordinator,
+    WeatherDataCoordinator,
+    _compute_session_fingerprint,
+    _refresh_session_fingerprint,
 )
 from custom_components.f1_sensor.const import (
     API_URL,
@@ -649,3 +653,54 @@ async def test_live_session_coordinator_fetch_index_timeout_returns_none(hass) -
     assert payload is None
     assert timeout_session.calls
     assert coordinator.last_http_status is None
+
+
+def test_session_fingerprint_ignores_key_order_and_detects_changes() -> None:
+    index = {
+        "Meetings": [{"Key": 1, "Name": "Monaco", "Sessions": [{"Key": 10}]}],
+        "Sessions": None,
+    }
+    reordered = {
+        "Sessions": None,
+        "Meetings": [{"Sessions": [{"Key": 10}], "Name": "Monaco", "Key": 1}],
+    }
+    changed = {
+        "Meetings": [{"Key": 1, "Name": "Monaco", "Sessions": [{"Key": 11}]}],
+    }
+    archived = {
+        "Meetings": [
+            {
+                "Key": 1,
+                "Name": "Monaco",
+                "Sessions": [{"Key": 10, "ArchiveStatus": {"Status": "Complete"}}],
+            }
+        ],
+    }
+
+    fp = _compute_session_fingerprint(index)
+
+    assert isinstance(fp, bytes)
+    assert fp == _compute_session_fingerprint(reordered)
+    assert fp != _compute_session_fingerprint(changed)
+    assert fp == _compute_session_fingerprint(archived)
+    assert _compute_session_fingerprint(["not", "a", "dict"]) is None
+    assert _refresh_session_fingerprint(None, index) == (fp, False)
+    assert _refresh_session_fingerprint(fp, reordered) == (fp, False)
+    assert _refresh_session_fingerprint(fp, changed)[1] is True
+    assert _refresh_session_fingerprint(fp, None) == (fp, False)
+
+
+@pytest.mark.asyncio
+async def test_weather_duplicate_check_compares_readings_as_strings(hass) -> None:
+    coordinator = WeatherDataCoordinator(hass, SimpleNamespace(data={}), bus=None)
+    coordinator._deliver({"AirTemp": 25.0, "Humidity": 1, "Rainfall": "0"})
+
+    assert coordinator._should_skip_duplicate(
+        {"AirTemp": "25.0", "Humidity": "1", "Rainfall": 0}
+    )
+    assert not coordinator._should_skip_duplicate(
+        {"AirTemp": 25.0, "Humidity": 1.0, "Rainfall": "0"}
+    )
+    assert not coordinator._should_skip_duplicate(
+        {"AirTemp": 25.0, "Humidity": 1, "Rainfall": "0", "Utc": "T1"}
+    )
@@ -498,3 +498,129 @@ def test_driver_positions_fastest_lap_hidden_non_race(hass) -> None:
         assert drv["fastest_lap"] is False
         assert drv["fastest_lap_time"] is None
         assert drv["fastest_lap_lap"] is None
+
+
+@pytest.mark.asyncio
+async def test_incremental_tyre_best_matches_full_recompute(hass) -> None:
+    coord = _make_coord(hass)
+    coord._merge_timingapp(
+        {
+            "Lines": {
+                "1": {"Stints": {"0": {"Compound": "SOFT", "New": "true"}}},
+                "44": {"Stints": {"0": {"Compound": "MEDIUM", "New": "true"}}},
+                "16": {"Stints": {"0": {"Compound": "SOFT", "New": "false"}}},
+            }
+        }
+    )
+    for rn, lap, lap_time in (
+        ("1", 1, "1:31.000"),
+        ("44", 1, "1:30.500"),
+        ("16", 1, "1:30.900"),
+        ("1", 2, "1:30.200"),
+        ("16", 2, "1:30.700"),
+    ):
+        coord._merge_timingdata(
+            {"Lines": {rn: {"NumberOfLaps": lap, "LastLapTime": {"Value": lap_time}}}}
+        )
+
+    incremental = coord._state["tyre_statistics"]
+    assert incremental["fastest_compound"] == "SOFT"
+    assert incremental["fastest_time"] == "1:30.200"
+    soft_best = incremental["compounds"]["SOFT"]["best_times"]
+    assert [row["racing_number"] for row in soft_best] == ["1", "16"]
+
+    coord._recompute_tyre_statistics()
+    assert coord._state["tyre_statistics"] == incremental
+
+
+@pytest.mark.asyncio
+async def test_slower_lap_keeps_stint_and_compound_best(hass) -> None:
+    coord = _make_coord(hass)
+    coord._merge_timingapp(
+        {"Lines": {"1": {"Stints": {"0": {"Compound": "SOFT", "New": "true"}}}}}
+    )
+    coord._merge_timingdata(
+        {"Lines": {"1": {"NumberOfLaps": 1, "LastLapTime": {"Value": "1:30.200"}}}}
+    )
+    before = coord._state["tyre_statistics"]
+
+    coord._merge_timingdata(
+        {"Lines": {"1": {"NumberOfLaps": 2, "LastLapTime": {"Value": "1:31.000"}}}}
+    )
+
+    stint = coord._state["drivers"]["1"]["tyre_history"]["stints"][0]
+    assert stint["best_lap_time"] == "1:30.200"
+    stats = coord._state["tyre_statistics"]
+    assert stats is before
+    assert stats["fastest_time"] == "1:30.200"
+    soft_best = stats["compounds"]["SOFT"]["best_times"]
+    assert [row["time"] for row in soft_best] == ["1:30.200"]
+
+
+@pytest.mark.asyncio
+async def test_driverlist_restamps_tyre_best_identity(hass) -> None:
+    coord = _make_coord(hass)
+    coord._merge_timingapp(
+        {"Lines": {"44": {"Stints": {"0": {"Compound": "SOFT", "New": "true"}}}}}
+    )
+    coord._merge_timingdata(
+        {"Lines": {"44": {"NumberOfLaps": 1, "LastLapTime": {"Value": "1:30.000"}}}}
+    )
+    before = coord._state["tyre_statistics"]
+    assert before["compounds"]["SOFT"]["best_times"][0]["driver_tla"] is None
+
+    coord._on_driverlist(
+        {"44": {"Tla": "HAM", "LastName": "Hamilton", "TeamColour": "6CD3BF"}}
+    )
+
+    row = coord._state["tyre_statistics"]["compounds"]["SOFT"]["best_times"][0]
+    assert row["driver_tla"] == "HAM"
+    assert row["driver_name"] == "Hamilton"
+    assert row["team_color"] == "6CD3BF"
+    assert before["compounds"]["SOFT"]["best_times"][0]["driver_tla"] is None
+    refreshed = coord._state["tyre_statistics"]
+    coord._recompute_tyre_statistics()
+    assert coord._state["tyre_statistics"] == refreshed
+
+
+@pytest.mark.asyncio
+async def test_replay_reset_clears_leader_position_index(hass) -> None:
+    coord = _make_coord(hass)
+    coord._merge_timingdata(
+        {"Lines": {"1": {"Position": "1"}, "44": {"Position": "2"}}}
+    )
+    assert coord._state["leader_rn"] == "1"
+
+    coord.reset_for_replay()
+    coord._merge_timingdata({"Lines": {"16": {"Position": "3"}}})
+
+    assert coord._position_index == {"16": 3}
+    assert coord._state["leader_rn"] == "16"
+
+
+@pytest.mark.asyncio
+async def test_stint_records_lap_time_seen_before_the_stint_opened(hass) -> None:
+    coord = _make_coord(hass)
+    coord._merge_timingdata(
+        {"Lines": {"44": {"NumberOfLaps": 1, "LastLapTime": {"Value": "1:30.000"}}}}
+    )
+    coord._merge_timingapp(
+        {
+            "Lines": {
+                "44": {
+                    "Stints": {
+                        "0": {
+                            "Compound": "SOFT",
+                            "LapTime": "1:30.000",
+                            "LapNumber": 1,
+                        }
+                    }
+                }
+            }
+        }
+    )
+
+    stint = coord._state["drivers"]["44"]["tyre_history"]["stints"][0]
+    assert stint["best_lap_time"] == "1:30.000"
+    soft = coord._state["tyre_statistics"]["compounds"]["SOFT"]
+    assert soft["best_times"][0]["time"] == "1:30.000"
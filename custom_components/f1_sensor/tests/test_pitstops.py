@@ -123,11 +123,11 @@ async def test_pit_delta_updates_after_lap_time_arrives(hass) -> None:
     assert stop["pit_delta"] is None
 
     drivers_coord.data["drivers"]["44"]["lap_history"]["laps"]["10"] = "1:45.000"
-    assert coordinator._refresh_pit_deltas() is False
+    assert coordinator._refresh_from_drivers_coordinator() is False
     assert stop["pit_delta"] is None
 
     drivers_coord.data["drivers"]["44"]["lap_history"]["laps"]["11"] = "1:30.000"
-    assert coordinator._refresh_pit_deltas() is True
+    assert coordinator._refresh_from_drivers_coordinator() is True
     assert stop["pit_delta"] == 15.0
 
 
@@ -222,8 +222,7 @@ async def test_pitstops_seed_from_driver_counts_when_series_missing(hass) -> Non
         drivers_coordinator=drivers_coord,
     )
 
-    assert coordinator._refresh_pit_counts_from_coordinator() is True
-    assert coordinator._refresh_driver_map_from_coordinator() is True
+    assert coordinator._refresh_from_drivers_coordinator() is True
     coordinator._deliver()
 
     state = coordinator.data
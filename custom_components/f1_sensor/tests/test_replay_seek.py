@@ -881,6 +881,36 @@ async def test_replay_weather_and_lap_count_coordinators_stay_available_in_repla
     await lap_count.async_close()
 
 
+@pytest.mark.asyncio
+async def test_lap_count_skips_listener_update_for_repeated_payload(hass) -> None:
+    bus = FakeLiveBus()
+    live_state = LiveAvailabilityTracker()
+    entry = _make_config_entry(hass)
+
+    lap_count = LapCountCoordinator(
+        hass,
+        session_coord=object(),
+        bus=bus,
+        config_entry=entry,
+        live_state=live_state,
+    )
+    await lap_count.async_config_entry_first_refresh()
+    live_state.set_state(True, "replay")
+
+    updates: list[dict | None] = []
+    unsub = lap_count.async_add_listener(lambda: updates.append(lap_count.data))
+
+    try:
+        lap_count._deliver({"CurrentLap": 3, "TotalLaps": 53})
+        lap_count._deliver({"CurrentLap": 3, "TotalLaps": 53})
+        lap_count._deliver({"CurrentLap": 4, "TotalLaps": 53})
+
+        assert [item["CurrentLap"] for item in updates] == [3, 4]
+    finally:
+        unsub()
+        await lap_count.async_close()
+
+
 @pytest.mark.asyncio
 async def test_championship_prediction_preserves_driver_identity_on_sparse_updates(
     hass,
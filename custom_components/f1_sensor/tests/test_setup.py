@@ -24,6 +24,8 @@ from custom_components.f1_sensor import (
     RaceControlCoordinator,
     RaceControlLogStore,
     _is_activity_log_excluded_entity,
+    _is_replay_delay_reason,
+    _is_replay_only_active_reason,
     _refresh_recorder_entity_filter,
     _wrap_activity_filter,
     _wrap_logbook_subscribe_events,
@@ -219,6 +221,18 @@ def test_activity_log_exclude_entity_matcher() -> None:
     assert not _is_activity_log_excluded_entity("binary_sensor.f1_track_time")
 
 
+def test_replay_reason_helpers_match_exact_reasons() -> None:
+    assert _is_replay_delay_reason("replay")
+    assert _is_replay_delay_reason("replay-mode")
+    assert _is_replay_delay_reason("replay-preparing")
+    assert not _is_replay_delay_reason("replay-completed")
+    assert not _is_replay_delay_reason("replay-stopped")
+    assert not _is_replay_delay_reason(None)
+    assert _is_replay_only_active_reason("replay")
+    assert not _is_replay_only_active_reason("replay-preparing")
+    assert not _is_replay_only_active_reason("replay-stopped")
+
+
 def test_activity_log_filter_wrapper() -> None:
     def base_filter(entity_id: str) -> bool:
         return entity_id != "sensor.block_me"